@@ -9,9 +9,9 @@ import json
 import sqlite3
 import logging
 import asyncio
-import traceback
 import time
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Callable
 from flask import Flask, request, jsonify, send_from_directory
 from dotenv import load_dotenv
@@ -211,6 +211,7 @@ from src.skills.media import (
     ImagePreviewSkill,
     VideoTourSkill,
 )
+from src.skills.response_cache import response_cache
 
 app = Flask(__name__)
 
@@ -644,7 +645,7 @@ def get_hotel_context(hotel_id):
             
             return hotel, recommendations
     except Exception as e:
-        print(f"Error fetching hotel context: {e}")
+        logger.error("Error fetching hotel context: %s", e)
         return None, []
 
 
@@ -677,7 +678,7 @@ def get_user_friendly_error(exception):
 
 
 # ── Chutes helpers ──
-def chutes_post_json(path: str, payload: dict, stream: bool = False):
+def chutes_post_json(path: str, payload: dict, stream: bool = False, timeout=(5, 60)):
     """Minimal JSON POST wrapper to Chutes with error handling."""
     if not CHUTES_API_KEY:
         raise ValueError("Chutes API key not configured")
@@ -685,7 +686,7 @@ def chutes_post_json(path: str, payload: dict, stream: bool = False):
     url = f"{CHUTES_BASE}{path}"
     log_payload = {k: v for k, v in payload.items() if k not in ("audio", "audio_base64", "input")}
     logger.info(f"[chutes] POST {path} stream={stream} payload={log_payload}")
-    r = requests.post(url, headers=CHUTES_HEADERS, json=payload, timeout=(5, 60), stream=stream)
+    r = requests.post(url, headers=CHUTES_HEADERS, json=payload, timeout=timeout, stream=stream)
     logger.info(f"[chutes] {path} -> HTTP {r.status_code}")
     if not stream and r.status_code != 200:
         try:
@@ -892,6 +893,10 @@ def call_chutes_tts(text: str, voice: str | None = None, language: str | None =
         raise
 
 
+# First sentence mentioning breakfast in a hotel knowledge base
+_BREAKFAST_RE = re.compile(r'breakfast[^.]*\.', re.IGNORECASE)
+
+
 def generate_demo_response(user_message, hotel_info=None, recommendations=None):
     """Generate a demo response when the API is unavailable (balance low, etc)."""
     msg_lower = user_message.lower()
@@ -901,11 +906,9 @@ def generate_demo_response(user_message, hotel_info=None, recommendations=None):
         if hotel_info and hotel_info.get('knowledge_base'):
             kb = hotel_info['knowledge_base']
             # Extract breakfast info if present
-            if 'breakfast' in kb.lower():
-                import re
-                match = re.search(r'breakfast[^.]*\.', kb, re.IGNORECASE)
-                if match:
-                    return f"📋 {match.group(0)} [Demo Mode]"
+            match = _BREAKFAST_RE.search(kb)
+            if match:
+                return f"📋 {match.group(0)} [Demo Mode]"
         return "Breakfast is typically served from 7:00 AM to 10:30 AM in our main dining room. [Demo Mode]"
     
     if any(word in msg_lower for word in ['wifi', 'internet', 'password']):
@@ -1106,6 +1109,7 @@ def health():
         "stt_endpoint": VOICE_LISTEN_LLM,
         "tts_endpoint": SPEECH_LLM,
         "cache": faq_cache.get_stats(),
+        "skill_cache": response_cache.get_stats(),
         "sessions": {
             "active": active_sessions,
             "total_messages": total_messages
@@ -1115,9 +1119,10 @@ def health():
 
 @app.route("/api/cache/clear", methods=["POST"])
 def clear_cache():
-    """Clear FAQ cache."""
+    """Clear FAQ and skill response caches."""
     stats_before = faq_cache.get_stats()
     faq_cache.clear()
+    response_cache.clear()
     return jsonify({
         "success": True,
         "cleared": stats_before["size"],
@@ -1458,6 +1463,31 @@ for skill in SKILLS:
     SKILL_MAP[skill.name] = skill
 
 
+# Shared pool for running a turn's tool calls concurrently
+TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
+# Opt-in: answer each cached skill's example utterances at boot so the
+# most common questions are cache hits from the first request.
+SKILL_CACHE_WARMUP = os.getenv("SKILL_CACHE_WARMUP", "false").lower() == "true"
+
+
+def _warmup_skills():
+    """Populate skill response caches from their example utterances."""
+    async def run():
+        await asyncio.gather(*(s.warmup() for s in SKILLS if hasattr(s, "warmup")))
+
+    start = time.time()
+    try:
+        asyncio.run(run())
+        logger.info(f"[warmup] skill caches warmed in {time.time() - start:.1f}s")
+    except Exception as e:
+        logger.warning(f"[warmup] skill cache warmup failed: {e}")
+
+
+if SKILL_CACHE_WARMUP and CHUTES_API_KEY:
+    TOOL_EXECUTOR.submit(_warmup_skills)
+
+
 def _execute_tool(tool_name: str, arguments: dict, session_id: str) -> str:
     """Execute a skill tool and return the result as a string."""
     # Voice call handled separately (Phase 3)
@@ -1741,15 +1771,24 @@ For general conversation, just respond directly without tools.{lang_instruction}
         if msg.get('tool_calls'):
             messages.append(msg)
 
+            calls = []
             for tool_call in msg['tool_calls']:
                 fn_name = tool_call['function']['name']
                 try:
                     fn_args = json.loads(tool_call['function']['arguments'])
                 except (json.JSONDecodeError, KeyError):
                     fn_args = {}
-
                 logger.info(f"[agent_loop] tool_call: {fn_name}({fn_args})")
-                result = _execute_tool(fn_name, fn_args, session_id)
+                calls.append((fn_name, fn_args, session_id))
+
+            # Parallel tool calls hit independent skill endpoints; run them
+            # concurrently so the turn waits for the slowest, not the sum.
+            if len(calls) > 1:
+                results = list(TOOL_EXECUTOR.map(lambda c: _execute_tool(*c), calls))
+            else:
+                results = [_execute_tool(*calls[0])]
+
+            for tool_call, result in zip(msg['tool_calls'], results):
                 logger.info(f"[agent_loop] tool_result: {result[:200]}")
 
                 messages.append({
@@ -1829,7 +1868,7 @@ def ping():
             {"model": "deepseek-ai/DeepSeek-V3-0324", "slug": "chutes-deepseek-ai-deepseek-v3-0324-tee"},
             {"model": "Qwen/Qwen3-32B", "slug": "chutes-qwen-qwen3-32b"},
         ]
-        for tm in chutes_test_models:
+        def probe(tm):
             model = tm["model"]
             slug = tm["slug"]
             t0 = time.time()
@@ -1849,23 +1888,27 @@ def ping():
                     # Strip thinking tags from reply
                     import re as _re
                     reply = _re.sub(r'<think>.*?</think>', '', reply, flags=_re.DOTALL).strip()
-                    chutes_results["tests"].append({
+                    return {
                         "model": model, "status": "ok",
                         "reply": reply,
                         "latency_ms": ms,
-                    })
-                else:
-                    try:
-                        msg = r.json().get("detail", r.text[:150])
-                    except Exception:
-                        msg = r.text[:150]
-                    chutes_results["tests"].append({"model": model, "status": "error", "detail": str(msg)[:200], "http": r.status_code, "latency_ms": ms})
+                    }
+                try:
+                    msg = r.json().get("detail", r.text[:150])
+                except Exception:
+                    msg = r.text[:150]
+                return {"model": model, "status": "error", "detail": str(msg)[:200], "http": r.status_code, "latency_ms": ms}
             except requests.Timeout:
                 ms = int((time.time() - t0) * 1000)
-                chutes_results["tests"].append({"model": model, "status": "error", "detail": "Timeout", "latency_ms": ms})
+                return {"model": model, "status": "error", "detail": "Timeout", "latency_ms": ms}
             except Exception as e:
                 ms = int((time.time() - t0) * 1000)
-                chutes_results["tests"].append({"model": model, "status": "error", "detail": str(e)[:200], "latency_ms": ms})
+                return {"model": model, "status": "error", "detail": str(e)[:200], "latency_ms": ms}
+
+        # Probe all models concurrently (submit all, then collect in order)
+        with ThreadPoolExecutor(max_workers=len(chutes_test_models)) as ex:
+            futures = [ex.submit(probe, tm) for tm in chutes_test_models]
+            chutes_results["tests"].extend(f.result() for f in futures)
     else:
         chutes_results["tests"].append({"model": "all", "status": "skip", "detail": "No API key"})
 
@@ -1976,9 +2019,7 @@ def chat():
 
     except Exception as e:
         error_msg = get_user_friendly_error(e)
-        print(f"Error in /api/chat: {str(e)}")
-        print(f"Error type: {type(e).__name__}")
-        traceback.print_exc()
+        logger.exception("Error in /api/chat (%s): %s", type(e).__name__, e)
         # Pop the user message if API call failed
         if session_id in conversations and len(conversations[session_id]) > 1:
             conversations[session_id].pop()
@@ -2217,8 +2258,7 @@ def voice_chat():
         return jsonify({"success": False, "error": msg, "reason": reason}), status
     except Exception as e:
         error_msg = get_user_friendly_error(e)
-        logger.error(f"Error in /api/voice-chat: {e}")
-        traceback.print_exc()
+        logger.exception("Error in /api/voice-chat: %s", e)
         return jsonify({"error": error_msg, "success": False, "reason": "voice_chat_failed"}), 500
 def video_status(task_id):
     """Check video generation status."""
@@ -2237,8 +2277,7 @@ def video_status(task_id):
 
     except Exception as e:
         error_msg = get_user_friendly_error(e)
-        print(f"Error in /api/voice-chat: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error in /api/voice-chat: %s", e)
         return jsonify({"error": error_msg, "success": False}), 500
 
 
@@ -2316,8 +2355,7 @@ def translate():
     
     except Exception as e:
         error_msg = get_user_friendly_error(e)
-        print(f"Error in /api/translate: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error in /api/translate: %s", e)
         return jsonify({"error": error_msg, "success": False}), 500
 
 
@@ -2340,8 +2378,7 @@ def tts():
         return jsonify({"error": msg, "success": False, "reason": f"tts_{sc}"}), 502
     except Exception as e:
         error_msg = get_user_friendly_error(e)
-        logger.error(f"TTS error: {e}")
-        traceback.print_exc()
+        logger.exception("TTS error: %s", e)
         return jsonify({"error": error_msg, "success": False, "reason": "tts_failed"}), 500
 
 
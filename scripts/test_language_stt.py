@@ -11,6 +11,7 @@ import sys
 import json
 import base64
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent dir to path for imports
@@ -19,6 +20,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 CHUTES_API_KEY = os.getenv("CHUTES_API_KEY")
 API_BASE = "http://localhost:8088"
 
+# Languages are independent; test them in parallel against the local API
+MAX_WORKERS = int(os.getenv("STT_TEST_WORKERS", "9"))
+
 # Test phrases for each language
 TEST_PHRASES = {
     "en": [
@@ -69,10 +73,10 @@ TEST_PHRASES = {
 }
 
 
-def generate_audio_from_text(text: str, language: str) -> str | None:
+def generate_audio_from_text(text: str, language: str, log=print) -> str | None:
     """
     Generate audio using our TTS endpoint.
-    Returns base64 audio or None on failure.
+    Returns base64 audio or None on failure (reported through log).
     """
     try:
         resp = requests.post(
@@ -84,17 +88,17 @@ def generate_audio_from_text(text: str, language: str) -> str | None:
             data = resp.json()
             return data.get("audio_base64")
         else:
-            print(f"  ⚠️  TTS failed: {resp.status_code}")
+            log(f"  ⚠️  TTS failed: {resp.status_code}")
             return None
     except Exception as e:
-        print(f"  ⚠️  TTS error: {e}")
+        log(f"  ⚠️  TTS error: {e}")
         return None
 
 
-def transcribe_audio(audio_b64: str, language: str) -> str | None:
+def transcribe_audio(audio_b64: str, language: str, log=print) -> str | None:
     """
     Transcribe audio using our STT endpoint.
-    Returns transcription text or None on failure.
+    Returns transcription text or None on failure (reported through log).
     """
     try:
         resp = requests.post(
@@ -106,10 +110,10 @@ def transcribe_audio(audio_b64: str, language: str) -> str | None:
             data = resp.json()
             return data.get("text", "")
         else:
-            print(f"  ⚠️  STT failed: {resp.status_code}")
+            log(f"  ⚠️  STT failed: {resp.status_code}")
             return None
     except Exception as e:
-        print(f"  ⚠️  STT error: {e}")
+        log(f"  ⚠️  STT error: {e}")
         return None
 
 
@@ -127,19 +131,23 @@ def test_language(lang_code: str, phrases: list[str]) -> dict:
     Test STT for a single language.
     Returns results dict with accuracy stats.
     """
-    print(f"\n{'='*60}")
-    print(f"Testing: {lang_code.upper()}")
-    print(f"{'='*60}")
+    # Buffer output so concurrently tested languages print as whole blocks
+    lines = []
+    log = lines.append
+
+    log(f"\n{'='*60}")
+    log(f"Testing: {lang_code.upper()}")
+    log(f"{'='*60}")
     
     results = []
     
     for i, original_text in enumerate(phrases, 1):
-        print(f"\n[{i}/{len(phrases)}] Original: {original_text}")
+        log(f"\n[{i}/{len(phrases)}] Original: {original_text}")
         
         # Generate audio from text using TTS
-        audio_b64 = generate_audio_from_text(original_text, lang_code)
+        audio_b64 = generate_audio_from_text(original_text, lang_code, log)
         if not audio_b64:
-            print("  ❌ TTS failed, skipping")
+            log("  ❌ TTS failed, skipping")
             results.append({
                 "original": original_text,
                 "transcribed": None,
@@ -149,9 +157,9 @@ def test_language(lang_code: str, phrases: list[str]) -> dict:
             continue
         
         # Transcribe audio back to text using STT
-        transcribed = transcribe_audio(audio_b64, lang_code)
+        transcribed = transcribe_audio(audio_b64, lang_code, log)
         if not transcribed:
-            print("  ❌ STT failed")
+            log("  ❌ STT failed")
             results.append({
                 "original": original_text,
                 "transcribed": None,
@@ -164,8 +172,8 @@ def test_language(lang_code: str, phrases: list[str]) -> dict:
         similarity = calculate_similarity(original_text, transcribed)
         status = "✅" if similarity > 0.8 else "⚠️" if similarity > 0.6 else "❌"
         
-        print(f"  Transcribed: {transcribed}")
-        print(f"  {status} Similarity: {similarity:.1%}")
+        log(f"  Transcribed: {transcribed}")
+        log(f"  {status} Similarity: {similarity:.1%}")
         
         results.append({
             "original": original_text,
@@ -181,6 +189,8 @@ def test_language(lang_code: str, phrases: list[str]) -> dict:
     else:
         avg_similarity = 0.0
     
+    print("\n".join(lines))
+
     return {
         "language": lang_code,
         "total_tests": len(phrases),
@@ -212,12 +222,9 @@ def main():
         print("💡 Start API with: python api/index.py")
         return 1
     
-    all_results = []
-    
-    # Test each language
-    for lang_code, phrases in TEST_PHRASES.items():
-        result = test_language(lang_code, phrases)
-        all_results.append(result)
+    # Test languages concurrently; results keep TEST_PHRASES order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        all_results = list(ex.map(test_language, TEST_PHRASES.keys(), TEST_PHRASES.values()))
     
     # Print summary
     print(f"\n{'='*60}")
@@ -2,7 +2,8 @@
 NomadAI Voice Agent - Skills System
 """
 
-from typing import Dict, Any, List, Protocol
+import functools
+from typing import Dict, Any, List, Protocol, Tuple
 
 
 class Skill(Protocol):
@@ -19,6 +20,12 @@ class Skill(Protocol):
 
 def get_all_skills() -> List[Any]:
     """Get all registered skills."""
+    return list(_build_skills())
+
+
+@functools.cache
+def _build_skills() -> Tuple[Any, ...]:
+    """Import and instantiate every skill once per process (skills are stateless)."""
     from .concierge import (
         RoomServiceSkill,
         HousekeepingSkill,
@@ -39,7 +46,7 @@ def get_all_skills() -> List[Any]:
         VideoTourSkill,
     )
 
-    return [
+    return (
         RoomServiceSkill(),
         HousekeepingSkill(),
         AmenitiesSkill(),
@@ -53,4 +60,4 @@ def get_all_skills() -> List[Any]:
         DirectionsSkill(),
         ImagePreviewSkill(),
         VideoTourSkill(),
-    ]
+    )
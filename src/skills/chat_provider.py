@@ -5,8 +5,15 @@ Shared by all skills instead of the ZhipuAI SDK.
 
 import os
 import re
+import json
+import hashlib
 import logging
+from concurrent.futures import Future
+from threading import Lock
+from typing import Dict, Iterator
+
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -16,14 +23,150 @@ CHUTES_API_KEY = os.getenv('CHUTES_API_KEY', '')
 DEFAULT_MODEL = 'deepseek-ai/DeepSeek-V3-0324'
 DEFAULT_SLUG = 'chutes-deepseek-ai-deepseek-v3-0324-tee'
 
+# Skill prompts ask for 2-3 sentence answers; cap generation accordingly
+# instead of letting the model run to its default limit.
+SKILL_MAX_TOKENS = 120
+
+# One HTTP session per process so skill calls reuse pooled TLS connections
+# instead of opening a fresh connection per request. The pool is sized for
+# concurrent tool calls (urllib3's default keeps only 10 per host).
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_SESSION.headers["Connection"] = "keep-alive"
+
+# Hint for providers that support explicit prompt caching. Chutes' vLLM/SGLang
+# backends reuse KV for identical prefixes automatically as long as the
+# system message is byte-identical across calls.
+PROMPT_CACHE_HEADERS = {'x-prompt-cache': '1'}
+
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
+# In-flight requests keyed by request digest (single-flight coalescing).
+# Identical concurrent requests wait on the leader's future instead of
+# issuing their own LLM call.
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = Lock()
 
-def skill_chat(messages, model_id=None, slug=None, temperature=0.7, max_tokens=1024):
+
+def _request_key(model, slug, messages, temperature, max_tokens):
+    """Digest of everything that determines the completion, including the chute serving it."""
+    raw = json.dumps([model, slug, temperature, max_tokens, messages], sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def skill_chat(messages, model_id=None, slug=None, temperature=0.7, max_tokens=SKILL_MAX_TOKENS,
+               extra_headers=None):
     """
     Chat completion via Chutes.ai for skill execution.
     Returns the assistant message text. Raises on error.
+
+    extra_headers are merged into the request headers (e.g. PROMPT_CACHE_HEADERS).
+
+    Concurrent calls with identical inputs are coalesced: only the first
+    caller hits the API, the others receive its result (or exception).
     """
     mid = model_id or DEFAULT_MODEL
-    s = slug or DEFAULT_SLUG
+    chute = slug or DEFAULT_SLUG
+    key = _request_key(mid, chute, messages, temperature, max_tokens)
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+
+    if not leader:
+        logger.info(f"[skill_chat] {mid} — joined in-flight request {key[:8]}")
+        return future.result()
+
+    try:
+        content = _post_chat(messages, mid, chute, temperature, max_tokens, extra_headers)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(content)
+        return content
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def skill_chat_stream(messages, model_id=None, slug=None, temperature=0.7,
+                      max_tokens=SKILL_MAX_TOKENS, extra_headers=None) -> Iterator[str]:
+    """
+    Streaming chat completion via Chutes.ai (server-sent events).
+    Yields text chunks as the model emits them, with <think> blocks removed,
+    so speech synthesis can start before the full answer is generated.
+    Raises on HTTP error before the first chunk.
+    """
+    mid = model_id or DEFAULT_MODEL
+    r = _chat_request(messages, mid, slug or DEFAULT_SLUG, temperature, max_tokens,
+                      extra_headers, stream=True)
+    try:
+        yield from _strip_think_stream(_sse_deltas(r))
+    finally:
+        r.close()
+
+
+def _sse_deltas(r) -> Iterator[str]:
+    """Content deltas from an OpenAI-style SSE completion stream."""
+    for line in r.iter_lines(decode_unicode=True):
+        if not line or not line.startswith('data:'):
+            continue
+        data = line[5:].strip()
+        if data == '[DONE]':
+            return
+        try:
+            delta = json.loads(data)['choices'][0].get('delta') or {}
+        except (ValueError, KeyError, IndexError):
+            continue
+        if delta.get('content'):
+            yield delta['content']
+
+
+def _partial_tag(text, tag):
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for k in range(min(len(text), len(tag) - 1), 0, -1):
+        if text.endswith(tag[:k]):
+            return k
+    return 0
+
+
+def _strip_think_stream(chunks) -> Iterator[str]:
+    """Drop <think>...</think> spans from a chunk stream (tags may straddle chunks)."""
+    buf, in_think, started = '', False, False
+    for chunk in chunks:
+        buf += chunk
+        out = []
+        while True:
+            tag = '</think>' if in_think else '<think>'
+            idx = buf.find(tag)
+            if idx >= 0:
+                if not in_think:
+                    out.append(buf[:idx])
+                buf = buf[idx + len(tag):]
+                in_think = not in_think
+                continue
+            keep = _partial_tag(buf, tag)
+            if not in_think:
+                out.append(buf[:len(buf) - keep])
+            buf = buf[len(buf) - keep:]
+            break
+
+        text = ''.join(out)
+        if not started:
+            text = text.lstrip()
+            started = bool(text)
+        if text:
+            yield text
+
+    if buf and not in_think:
+        yield buf.lstrip() if not started else buf
+
+
+def _chat_request(messages, mid, s, temperature, max_tokens, extra_headers=None, stream=False):
+    """POST a chat completion request to a Chutes model endpoint; raise on HTTP error."""
     url = f"https://{s}.chutes.ai/v1/chat/completions"
 
     if not CHUTES_API_KEY:
@@ -33,6 +176,8 @@ def skill_chat(messages, model_id=None, slug=None, temperature=0.7, max_tokens=1
         'Authorization': f'Bearer {CHUTES_API_KEY}',
         'Content-Type': 'application/json',
     }
+    if extra_headers:
+        headers.update(extra_headers)
 
     payload = {
         'model': mid,
@@ -40,10 +185,12 @@ def skill_chat(messages, model_id=None, slug=None, temperature=0.7, max_tokens=1
         'temperature': temperature,
         'max_tokens': max_tokens,
     }
+    if stream:
+        payload['stream'] = True
 
-    logger.info(f"[skill_chat] {mid} — {len(messages)} msgs")
+    logger.info(f"[skill_chat] {mid} — {len(messages)} msgs{' (stream)' if stream else ''}")
 
-    r = requests.post(url, headers=headers, json=payload, timeout=(5, 60))
+    r = _SESSION.post(url, headers=headers, json=payload, timeout=(5, 60), stream=stream)
 
     if r.status_code != 200:
         try:
@@ -51,13 +198,18 @@ def skill_chat(messages, model_id=None, slug=None, temperature=0.7, max_tokens=1
             msg = body.get("error", {}).get("message", r.text[:200])
         except Exception:
             msg = r.text[:200]
+        r.close()
         raise RuntimeError(f"[Chutes] HTTP {r.status_code}: {msg}")
 
-    data = r.json()
-    msg_obj = data['choices'][0]['message']
+    return r
+
+
+def _post_chat(messages, mid, s, temperature, max_tokens, extra_headers=None):
+    """Single chat completion request to a Chutes model endpoint."""
+    r = _chat_request(messages, mid, s, temperature, max_tokens, extra_headers)
+
+    msg_obj = r.json()['choices'][0]['message']
     content = msg_obj.get('content') or msg_obj.get('reasoning_content') or ''
 
     # Strip <think>...</think> blocks from reasoning models
-    content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL).strip()
-
-    return content
+    return _THINK_RE.sub('', content).strip()
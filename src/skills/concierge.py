@@ -5,6 +5,7 @@ Uses Chutes.ai via shared chat_provider.
 """
 
 import os
+import asyncio
 from typing import Dict, Any, List
 from src.skills.chat_provider import skill_chat
 
@@ -12,6 +13,8 @@ from src.skills.chat_provider import skill_chat
 class RoomServiceSkill:
     """Handle food and beverage orders."""
 
+    __slots__ = ()
+
     name = "room_service"
     description = "Process room service orders for food and beverages"
     example_utterances = [
@@ -22,6 +25,16 @@ class RoomServiceSkill:
         "I need food delivered to my room",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel room service assistant. Reply in 2-3 sentences.\n"
+            "Menu: breakfast (Continental, American, Japanese); lunch/dinner (burgers, pasta, "
+            "local cuisine); drinks (coffee, tea, soft drinks, wine).\n"
+            "Confirm the order and room number before processing."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -29,20 +42,9 @@ class RoomServiceSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a hotel room service assistant.
-                Help guests order food and beverages. Be concise (2-3 sentences).
-                Available items: Breakfast (Continental, American, Japanese),
-                Lunch/Dinner (Burgers, Pasta, Local cuisine),
-                Beverages (Coffee, Tea, Soft drinks, Wine).
-                Always confirm the order and room number before processing."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -58,6 +60,8 @@ class RoomServiceSkill:
 class HousekeepingSkill:
     """Handle housekeeping and cleaning requests."""
 
+    __slots__ = ()
+
     name = "housekeeping"
     description = "Process housekeeping requests like extra towels, cleaning, etc."
     example_utterances = [
@@ -68,6 +72,15 @@ class HousekeepingSkill:
         "Can you clean my room now?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel housekeeping coordinator. Reply in 2-3 sentences.\n"
+            "Services: towels/linens, room cleaning, toiletries, pillows/blankets, laundry.\n"
+            "Confirm the request with an ETA (usually 15-30 min)."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -75,19 +88,9 @@ class HousekeepingSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a hotel housekeeping coordinator.
-                Help guests with housekeeping requests. Be concise (2-3 sentences).
-                Available services: Extra towels/linens, room cleaning,
-                toiletries, pillows/blankets, laundry service.
-                Confirm the request and provide estimated time (usually 15-30 minutes)."""
-            },
-            {"role": "user", "content": transcription}
-        ]
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
 
-        assistant_message = skill_chat(messages)
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -103,6 +106,8 @@ class HousekeepingSkill:
 class AmenitiesSkill:
     """Answer questions about hotel amenities and facilities."""
 
+    __slots__ = ()
+
     name = "amenities_info"
     description = "Provide information about hotel amenities, hours, and facilities"
     example_utterances = [
@@ -113,6 +118,17 @@ class AmenitiesSkill:
         "What amenities do you have?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel information assistant. Reply in 2-3 sentences.\n"
+            "Hours: pool 6AM-10PM; gym 24/7 (room key); spa 9AM-9PM (booking required); "
+            "restaurant breakfast 6-10AM, lunch 12-3PM, dinner 6-10PM; bar 5PM-1AM; "
+            "business center 24/7; concierge desk 7AM-11PM.\n"
+            "Parking: valet and self-parking."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -120,31 +136,9 @@ class AmenitiesSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        amenities_kb = """
-        Hotel Amenities:
-        - Pool: Open 6 AM - 10 PM daily
-        - Gym: 24/7 access with room key
-        - Spa: 9 AM - 9 PM, booking required
-        - Restaurant: Breakfast 6-10 AM, Lunch 12-3 PM, Dinner 6-10 PM
-        - Bar: 5 PM - 1 AM
-        - Business Center: 24/7 access
-        - Concierge Desk: 7 AM - 11 PM
-        - Parking: Valet and self-parking available
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a hotel information assistant.
-                Provide accurate information about hotel amenities. Be concise (2-3 sentences).
-                Use this knowledge base:
-                {amenities_kb}
-                """
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -160,6 +154,8 @@ class AmenitiesSkill:
 class WifiSkill:
     """Provide WiFi credentials and connectivity help."""
 
+    __slots__ = ()
+
     name = "wifi_help"
     description = "Provide WiFi password and help with connectivity issues"
     example_utterances = [
@@ -170,6 +166,16 @@ class WifiSkill:
         "What's the network name?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel IT support. Reply in 2-3 sentences.\n"
+            "WiFi: NomadAI-Guest / Welcome2026!; faster: NomadAI-Premium "
+            "(password in welcome packet).\n"
+            "Connection issues: restart device | forget network and reconnect | contact front desk."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -177,30 +183,9 @@ class WifiSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        wifi_info = """
-        Network Name: NomadAI-Guest
-        Password: Welcome2026!
-
-        For faster speeds, use:
-        Network Name: NomadAI-Premium
-        Password: (Available in your welcome packet)
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a hotel IT support assistant.
-                Help guests connect to WiFi. Be concise (2-3 sentences).
-                WiFi Information:
-                {wifi_info}
-
-                If they have connectivity issues, suggest: restart device,
-                forget network and reconnect, or contact front desk."""
-            },
-            {"role": "user", "content": transcription}
-        ]
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
 
-        assistant_message = skill_chat(messages)
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -216,6 +201,8 @@ class WifiSkill:
 class CheckOutSkill:
     """Handle guest checkout process."""
 
+    __slots__ = ()
+
     name = "check_out"
     description = "Assist with hotel checkout process and final billing"
     example_utterances = [
@@ -226,6 +213,16 @@ class CheckOutSkill:
         "I want to settle my bill",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel front desk checkout assistant. Reply in 2-3 sentences.\n"
+            "Steps: confirm room number; review final bill (room rate + charges); "
+            "payment (card on file or new); return key card.\n"
+            "Checkout 11:00 AM; late checkout until 2 PM ($50); express checkout via app or phone."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -233,26 +230,9 @@ class CheckOutSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a hotel front desk checkout assistant.
-                Help guests with checkout process. Be concise (2-3 sentences).
-                
-                Checkout Process:
-                1. Confirm room number
-                2. Review final bill (room rate + any charges)
-                3. Payment method (card on file or new payment)
-                4. Return key card
-                5. Late checkout available until 2 PM ($50 fee)
-                
-                Standard checkout time: 11:00 AM
-                Express checkout: Available via app or phone"""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -268,6 +248,8 @@ class CheckOutSkill:
 class ComplaintsSkill:
     """Handle guest complaints and service recovery."""
 
+    __slots__ = ()
+
     name = "complaints"
     description = "Log and acknowledge guest complaints or issues"
     example_utterances = [
@@ -278,6 +260,17 @@ class ComplaintsSkill:
         "There's a problem with my room",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel guest relations manager; empathetic and urgent. Reply in 2-3 sentences.\n"
+            "Protocol: acknowledge and apologize; clarify; offer a fix or escalate; give a timeline.\n"
+            "Fixes: room issue -> room change or immediate maintenance; noise -> quieter floor; "
+            "service -> manager follow-up within 30 min; billing -> front desk review.\n"
+            "Thank the guest for raising it."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -285,30 +278,9 @@ class ComplaintsSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a hotel guest relations manager.
-                Handle complaints with empathy and urgency. Be concise (2-3 sentences).
-                
-                Response Protocol:
-                1. Acknowledge and apologize
-                2. Clarify the issue
-                3. Offer immediate solution or escalation
-                4. Provide timeline for resolution
-                
-                Common Solutions:
-                - Room issues → Offer room change or immediate maintenance
-                - Noise → Move to quieter floor
-                - Service issues → Manager follow-up within 30 min
-                - Billing disputes → Front desk review
-                
-                Always thank them for bringing it to our attention."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -325,6 +297,8 @@ class ComplaintsSkill:
 class WakeUpCallSkill:
     """Schedule wake-up calls for guests."""
 
+    __slots__ = ()
+
     name = "wake_up_call"
     description = "Schedule morning wake-up calls"
     example_utterances = [
@@ -335,6 +309,15 @@ class WakeUpCallSkill:
         "Can you call my room at 8 AM?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel wake-up call coordinator. Reply in 2-3 sentences.\n"
+            "Confirm time, room number and date (today/tomorrow); always repeat the confirmed time.\n"
+            "Rules: 5:00-11:00 AM; up to 7 days ahead; automated call, 10 min snooze; guest's timezone."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -342,30 +325,9 @@ class WakeUpCallSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a hotel wake-up call coordinator.
-                Schedule wake-up calls for guests. Be concise (2-3 sentences).
-                
-                Process:
-                1. Confirm time (use 12-hour or 24-hour format)
-                2. Confirm room number
-                3. Confirm date (today/tomorrow)
-                4. Set reminder
-                
-                Wake-up Call Features:
-                - Available 5:00 AM to 11:00 AM
-                - Can schedule up to 7 days in advance
-                - Automated call with option to snooze (10 min)
-                - Confirm time in guest's timezone
-                
-                Always repeat back the confirmed time."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
@@ -381,6 +343,8 @@ class WakeUpCallSkill:
 class BillingInquirySkill:
     """Provide billing and folio information."""
 
+    __slots__ = ()
+
     name = "billing_inquiry"
     description = "Answer questions about guest bill and charges"
     example_utterances = [
@@ -391,6 +355,18 @@ class BillingInquirySkill:
         "Can I see my folio?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: hotel billing assistant. Reply in 2-3 sentences.\n"
+            "Folio: room $150/night x2 = $300; room service $45; minibar $18; "
+            "parking $25/day x2 = $50; tax 12% = $49.56; total $462.56.\n"
+            "Policy: charges post within 24h; minibar at checkout; disputes -> front desk; "
+            "pay by card on file or at checkout.\n"
+            "Always offer a detailed breakdown by email."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -398,38 +374,9 @@ class BillingInquirySkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        mock_folio = """
-        Sample Charges:
-        - Room Rate: $150/night × 2 nights = $300
-        - Room Service: $45
-        - Minibar: $18
-        - Parking: $25/day × 2 = $50
-        - Tax (12%): $49.56
-        Total: $462.56
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a hotel billing assistant.
-                Answer billing questions clearly. Be concise (2-3 sentences).
-                
-                Mock Folio Data:
-                {mock_folio}
-                
-                Billing Information:
-                - All charges posted within 24 hours
-                - Minibar charges at checkout
-                - Disputes: Contact front desk
-                - Payment: Card on file or at checkout
-                - Detailed invoice available via email
-                
-                Always offer to send detailed breakdown to guest's email."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages)
 
         return {
             "response": assistant_message,
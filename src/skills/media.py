@@ -6,13 +6,16 @@ Note: Image/video generation is not available via Chutes; we return rich text de
 """
 
 import os
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any
 from src.skills.chat_provider import skill_chat
 
 
 class ImagePreviewSkill:
     """Generate destination preview descriptions (image generation not available)."""
 
+    __slots__ = ()
+
     name = "image_preview"
     description = "Describe destinations and attractions visually"
     example_utterances = [
@@ -23,6 +26,15 @@ class ImagePreviewSkill:
         "Create an image of the local market",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: vivid travel describer. Image generation is unavailable: describe the place "
+            "visually in 3-5 sentences (colors, atmosphere, architecture, what makes it special).\n"
+            "End with a visiting tip."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -30,19 +42,9 @@ class ImagePreviewSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a vivid travel describer.
-                The user wants to see what a place looks like. Since image generation is not available,
-                provide a rich, detailed visual description of the place (3-5 sentences).
-                Include colors, atmosphere, architecture, and what makes it special.
-                End with a helpful tip about visiting."""
-            },
-            {"role": "user", "content": transcription}
-        ]
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
 
-        assistant_message = skill_chat(messages)
+        assistant_message = await asyncio.to_thread(skill_chat, messages, max_tokens=140)
 
         return {
             "response": assistant_message,
@@ -58,6 +60,8 @@ class ImagePreviewSkill:
 class VideoTourSkill:
     """Generate tour descriptions (video generation not available)."""
 
+    __slots__ = ()
+
     name = "video_tour"
     description = "Describe personalized tour routes and virtual tours"
     example_utterances = [
@@ -68,6 +72,14 @@ class VideoTourSkill:
         "Can you create a virtual tour?",
     ]
 
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": (
+            "Role: virtual tour narrator. Video generation is unavailable: narrate a vivid "
+            "4-6 sentence walking tour (sights, sounds, feel, landmarks, local details)."
+        ),
+    }
+
     def __init__(self):
         pass
 
@@ -75,19 +87,9 @@ class VideoTourSkill:
         transcription = context.get("transcription", "")
         session_id = context.get("session_id", "default")
 
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a virtual tour narrator.
-                The user wants a video tour. Since video generation is not available,
-                narrate a vivid walking tour (4-6 sentences) as if guiding them through the scene.
-                Describe what they would see, hear, and feel along the route.
-                Include landmarks, atmosphere, and local details."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": transcription}]
+
+        assistant_message = await asyncio.to_thread(skill_chat, messages, max_tokens=180)
 
         return {
             "response": assistant_message,
@@ -0,0 +1,259 @@
+"""
+Response cache for skill LLM calls.
+
+Exact-match LRU with TTL keyed by (skill, normalized transcription), with
+near-duplicate matching and an optional semantic tier that reuses an answer
+for a paraphrased question.
+"""
+
+import os
+import re
+import time
+import string
+import hashlib
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.skills.chat_provider import skill_chat, skill_chat_stream
+
+logger = logging.getLogger(__name__)
+
+SKILL_CACHE_TTL = int(os.getenv("SKILL_CACHE_TTL", "3600"))
+SKILL_CACHE_MAX_SIZE = 2048
+SKILL_CACHE_ENABLED = os.getenv("SKILL_CACHE_ENABLED", "true").lower() == "true"
+
+# Semantic tier needs sentence-transformers and a local model; opt-in only.
+SEMANTIC_CACHE_ENABLED = os.getenv("SKILL_CACHE_SEMANTIC", "false").lower() == "true"
+SEMANTIC_MODEL = os.getenv("SKILL_CACHE_SEMANTIC_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+SEMANTIC_THRESHOLD = 0.92
+SEMANTIC_MAX_PER_SKILL = 256
+
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return _SPACE_RE.sub(" ", text.lower().strip().translate(_PUNCT_TABLE)).strip()
+
+
+def _variant_key(normalized: str) -> str:
+    """
+    Near-duplicate key: the same words in the same order, ignoring spacing
+    and a trailing "s" (plurals, and possessives once punctuation is gone).
+    """
+    return "".join(word[:-1] if word.endswith("s") else word for word in normalized.split())
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with TTL for skill responses.
+    """
+    def __init__(self, max_size: int = SKILL_CACHE_MAX_SIZE, ttl: int = SKILL_CACHE_TTL,
+                 semantic: bool = False):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.semantic = semantic
+        self._cache = OrderedDict()  # key: (response, expiry_ts, skill, variant key)
+        self._variants: Dict[str, Dict[str, bytes]] = {}  # skill: {variant key: latest key}
+        self._vectors: Dict[str, List[Tuple[List[float], str, float]]] = {}  # skill: [(embedding, response, expiry_ts)]
+        self._lock = Lock()
+        self.stats = {"hits": 0, "fuzzy_hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0}
+
+    def _make_key(self, skill_name: str, normalized: str) -> bytes:
+        return hashlib.blake2b(f"{skill_name}|{normalized}".encode(), digest_size=16).digest()
+
+    def _drop(self, key: bytes):
+        """Remove an entry and its variant index record. Caller holds the lock."""
+        _, _, skill_name, variant = self._cache.pop(key)
+        variants = self._variants.get(skill_name, {})
+        if variants.get(variant) == key:
+            del variants[variant]
+
+    def _live(self, key: bytes) -> Optional[str]:
+        """Return a non-expired entry's response, refreshing LRU order. Caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            self._drop(key)
+            return None
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def get(self, skill_name: str, query: str, count_miss: bool = True) -> Optional[str]:
+        """
+        Get cached response for the same or a near-duplicate query.
+
+        Callers that try the semantic tier next pass count_miss=False and
+        call record_miss() only if that misses too.
+        """
+        if not SKILL_CACHE_ENABLED:
+            return None
+
+        normalized = normalize_query(query)
+        with self._lock:
+            response = self._live(self._make_key(skill_name, normalized))
+            if response is not None:
+                self.stats["hits"] += 1
+                return response
+
+            key = self._variants.get(skill_name, {}).get(_variant_key(normalized))
+            if key is not None:
+                response = self._live(key)
+                if response is not None:
+                    self.stats["fuzzy_hits"] += 1
+                    return response
+
+            if count_miss:
+                self.stats["misses"] += 1
+            return None
+
+    def record_miss(self):
+        """Count a lookup that missed every tier."""
+        with self._lock:
+            self.stats["misses"] += 1
+
+    def get_similar(self, skill_name: str, embedding: List[float]) -> Optional[str]:
+        """Get the cached response whose query embedding is closest, above threshold."""
+        if not SKILL_CACHE_ENABLED:
+            return None
+
+        now = time.time()
+        best_score, best_response = SEMANTIC_THRESHOLD, None
+        with self._lock:
+            entries = [e for e in self._vectors.get(skill_name, []) if e[2] > now]
+            self._vectors[skill_name] = entries
+            for vec, response, _ in entries:
+                # Embeddings are L2-normalized, so the dot product is the cosine
+                score = sum(a * b for a, b in zip(vec, embedding))
+                if score > best_score:
+                    best_score, best_response = score, response
+
+            if best_response is not None:
+                self.stats["semantic_hits"] += 1
+                logger.info(f"[skill_cache] SEMANTIC HIT skill={skill_name} score={best_score:.3f}")
+            return best_response
+
+    def set(self, skill_name: str, query: str, response: str,
+            embedding: Optional[List[float]] = None):
+        """Cache a response (and its query embedding, if given)."""
+        if not SKILL_CACHE_ENABLED:
+            return
+
+        normalized = normalize_query(query)
+        key = self._make_key(skill_name, normalized)
+        expiry = time.time() + self.ttl
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_size:
+                self._drop(next(iter(self._cache)))
+                self.stats["evictions"] += 1
+            variant = _variant_key(normalized)
+            self._cache[key] = (response, expiry, skill_name, variant)
+            self._cache.move_to_end(key)
+            self._variants.setdefault(skill_name, {})[variant] = key
+
+            if embedding is not None:
+                entries = self._vectors.setdefault(skill_name, [])
+                entries.append((embedding, response, expiry))
+                if len(entries) > SEMANTIC_MAX_PER_SKILL:
+                    del entries[0]
+
+    def clear(self):
+        """Clear all cache entries."""
+        with self._lock:
+            self._cache.clear()
+            self._variants.clear()
+            self._vectors.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            hits = self.stats["hits"] + self.stats["fuzzy_hits"] + self.stats["semantic_hits"]
+            total = hits + self.stats["misses"]
+            return {
+                "enabled": SKILL_CACHE_ENABLED,
+                "semantic": self.semantic,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                **self.stats,
+                "hit_rate": round(hits / total, 3) if total > 0 else 0.0,
+            }
+
+
+response_cache = ResponseCache(semantic=SEMANTIC_CACHE_ENABLED)
+
+_embedder = None
+_embedder_lock = Lock()
+
+
+def _embed(text: str) -> Optional[List[float]]:
+    """Embed a query with the local sentence model; None if unavailable."""
+    global _embedder
+    with _embedder_lock:
+        if _embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                _embedder = SentenceTransformer(SEMANTIC_MODEL)
+            except Exception as e:
+                logger.warning(f"[skill_cache] semantic tier disabled: {e}")
+                response_cache.semantic = False
+                return None
+    return _embedder.encode(normalize_query(text), normalize_embeddings=True).tolist()
+
+
+def cached_skill_chat(skill_name: str, messages: list, **kwargs) -> str:
+    """
+    skill_chat() behind the response cache.
+
+    The cache key is the skill name plus the last (user) message, so callers
+    must use a fixed system prompt per skill. Extra kwargs go to skill_chat.
+    """
+    query = messages[-1]["content"]
+    semantic = response_cache.semantic and SKILL_CACHE_ENABLED
+
+    cached = response_cache.get(skill_name, query, count_miss=not semantic)
+    if cached is not None:
+        return cached
+
+    embedding = None
+    if semantic:
+        embedding = _embed(query)
+        if embedding is not None:
+            cached = response_cache.get_similar(skill_name, embedding)
+            if cached is not None:
+                return cached
+        response_cache.record_miss()
+
+    response = skill_chat(messages, **kwargs)
+    # An empty answer (e.g. max_tokens spent inside <think>) must not be served for a whole TTL
+    if response:
+        response_cache.set(skill_name, query, response, embedding)
+    return response
+
+
+def cached_skill_chat_stream(skill_name: str, messages: list, **kwargs) -> Iterator[str]:
+    """
+    skill_chat_stream() behind the response cache.
+
+    A cache hit is yielded as a single chunk; a miss streams from the
+    provider and caches the assembled answer (if non-empty) once the stream
+    completes.
+    """
+    query = messages[-1]["content"]
+
+    cached = response_cache.get(skill_name, query)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks = []
+    for chunk in skill_chat_stream(messages, **kwargs):
+        chunks.append(chunk)
+        yield chunk
+    response = "".join(chunks).strip()
+    if response:
+        response_cache.set(skill_name, query, response)
@@ -5,182 +5,234 @@ Uses Chutes.ai via shared chat_provider.
 """
 
 import os
-from typing import Dict, Any, List
-from src.skills.chat_provider import skill_chat
+import re
+import asyncio
+from typing import Dict, Any, List, Tuple
+from src.skills.chat_provider import SKILL_MAX_TOKENS, PROMPT_CACHE_HEADERS
+from src.skills.response_cache import cached_skill_chat, cached_skill_chat_stream, normalize_query
+
+# Fallback values for missing context keys, named in one place
+_DEFAULT_SESSION = "default"
+_DEFAULT_LOCATION = "the area"
+_DEFAULT_HOTEL = "the hotel"
+
+# Sentence boundaries, so TTS can synthesize sentences independently
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Conversational filler that carries no request; answered without the LLM
+_FILLER = frozenset({"thanks", "thank you", "ok", "okay", "huh", "what", "hmm", "yes", "no"})
+_FILLER_RESPONSE = "Let me know what you'd like to see!"
+
+# Knowledge bases are kept compact: every prompt token is paid on every call.
+_LOCAL_KB = (
+    "ramen:Ichiran@5w,Ippudo@10w; sushi:Sushi Dai@15,Tsukiji Market; "
+    "coffee:Blue Bottle@3,Starbucks Reserve@8; sights:Temple@10,Museum@15; "
+    "shopping:Local market@5,Mall@20; parks:Central Park@7w"
+)
+
+_ITINERARY_KB = (
+    "4h cultural:Temple 1h>Museum 1.5h>Local lunch 1h>Market 30m; "
+    "half-day food:Breakfast spot>Coffee>Market tour>Lunch; "
+    "walking:Park>Historic district>Shopping street>Cafe; "
+    "family:Aquarium 2h>Park 1h>Kids restaurant"
+)
+
+_DIRECTIONS_KB = (
+    "Shibuya Station:walk 10 east|subway 5; nearest subway:exit, turn right, walk 3; "
+    "airport:Narita Express 45|bus 60; Temple:walk 10 north via park; "
+    "Museum:walk 15|subway 2 stops"
+)
+
+_RECOMMENDATION_PROMPT = (
+    "Role: local expert and tour guide. Recommend authentic local places for "
+    "the guest's preferences in 2-3 sentences, with distance/time.\n"
+    f"Places (category:place@minutes, w=walk): {_LOCAL_KB}\n"
+    "Consider cuisine, distance, price, current time and opening hours."
+)
+
+_ITINERARY_PROMPT = (
+    "Role: tour planner. Build a concise bulleted itinerary for the guest's "
+    "available time and interests, with specific timing and locations.\n"
+    f"Route templates (stop duration, > = next): {_ITINERARY_KB}\n"
+    "Consider walking distance, meal times and opening hours."
+)
+
+_DIRECTIONS_PROMPT = (
+    "Role: navigation assistant. Give clear step-by-step directions in 2-4 sentences.\n"
+    f"Routes from hotel (minutes, | = alternative): {_DIRECTIONS_KB}\n"
+    "Include time, transport options, landmarks and distance. Prefer walking under 15 min."
+)
+
+
+class LLMSkill:
+    """
+    Skill answered by a single LLM call with a fixed system prompt.
+
+    If the context carries a ``stream_queue`` (asyncio.Queue), response text
+    is pushed onto it chunk by chunk as it streams in, followed by None; the
+    full text is still returned in ``response``.
+
+    Args:
+        name: Skill/tool name.
+        description: Human-readable description used for routing.
+        example_utterances: Sample phrases that trigger the skill.
+        system_prompt: Fixed system prompt (knowledge base included).
+        action: Value for the result's ``action`` field.
+        max_tokens: Generation cap for the LLM call.
+        context_metadata: Metadata keys copied from the context, as
+            ``{metadata_key: (context_key, default)}``.
+        metadata: Static metadata added to every result.
+    """
+
+    __slots__ = (
+        "name", "description", "example_utterances",
+        "_system_msg", "_action", "_max_tokens", "_context_metadata", "_metadata",
+    )
+
+    def __init__(self, name: str, description: str, example_utterances: List[str],
+                 system_prompt: str, action: str, max_tokens: int = SKILL_MAX_TOKENS,
+                 context_metadata: Dict[str, Tuple[str, Any]] = None,
+                 metadata: Dict[str, Any] = None):
+        self.name = name
+        self.description = description
+        self.example_utterances = example_utterances
+        self._system_msg = {"role": "system", "content": system_prompt}
+        self._action = action
+        self._max_tokens = max_tokens
+        self._context_metadata = context_metadata or {}
+        self._metadata = metadata or {}
 
+    async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        get = context.get
+        transcription = get("transcription", "")
+
+        normalized = normalize_query(transcription)
+        if normalized in _FILLER:
+            stream_queue = get("stream_queue")
+            if stream_queue is not None:
+                stream_queue.put_nowait(_FILLER_RESPONSE)
+                stream_queue.put_nowait(None)
+            return {
+                "response": _FILLER_RESPONSE,
+                "action": "skill_bypassed",
+                "metadata": {
+                    "skill": self.name,
+                    "session_id": get("session_id", _DEFAULT_SESSION),
+                    "sentences": [_FILLER_RESPONSE],
+                },
+            }
 
-class RecommendationSkill:
-    """Provide local place recommendations."""
+        messages = [self._system_msg, {"role": "user", "content": transcription}]
+
+        # The system message is built once, so every call shares a
+        # byte-identical prefix the provider can serve from its KV cache.
+        stream_queue = get("stream_queue")
+        if stream_queue is None:
+            assistant_message = await asyncio.to_thread(
+                cached_skill_chat, self.name, messages,
+                max_tokens=self._max_tokens, extra_headers=PROMPT_CACHE_HEADERS,
+            )
+        else:
+            assistant_message = await asyncio.to_thread(
+                self._stream, messages, stream_queue, asyncio.get_running_loop()
+            )
+
+        metadata = {"skill": self.name, "session_id": get("session_id", _DEFAULT_SESSION)}
+        for key, (context_key, default) in self._context_metadata.items():
+            metadata[key] = get(context_key, default)
+        metadata.update(self._metadata)
+        metadata["sentences"] = _SENT_SPLIT.split(assistant_message) if assistant_message else []
 
-    name = "local_recommendations"
-    description = "Suggest local restaurants, attractions, and points of interest"
-    example_utterances = [
+        return {
+            "response": assistant_message,
+            "action": self._action,
+            "metadata": metadata,
+        }
+
+    async def warmup(self):
+        """Pre-populate the response cache with this skill's example utterances."""
+        await asyncio.gather(
+            *(self.execute({"transcription": u, "session_id": "_warmup"}) for u in self.example_utterances),
+            return_exceptions=True,
+        )
+
+    def _stream(self, messages: List[Dict[str, str]], queue: asyncio.Queue,
+                loop: asyncio.AbstractEventLoop) -> str:
+        """Push streamed chunks onto queue (None marks the end); return the full text."""
+        chunks = []
+        try:
+            for chunk in cached_skill_chat_stream(
+                self.name, messages,
+                max_tokens=self._max_tokens, extra_headers=PROMPT_CACHE_HEADERS,
+            ):
+                chunks.append(chunk)
+                loop.call_soon_threadsafe(queue.put_nowait, chunk)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+        return "".join(chunks).strip()
+
+
+RECOMMENDATION = LLMSkill(
+    name="local_recommendations",
+    description="Suggest local restaurants, attractions, and points of interest",
+    example_utterances=[
         "Where's good ramen nearby?",
         "Recommend a local restaurant",
         "What should I see in the area?",
         "Where can I get authentic food?",
         "Best coffee shop nearby?",
-    ]
-
-    def __init__(self):
-        pass
-
-    async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        transcription = context.get("transcription", "")
-        session_id = context.get("session_id", "default")
-        location = context.get("location", "the area")
-
-        local_kb = """
-        Popular Local Spots:
-        - Ramen: Ichiran (5 min walk), Ippudo (10 min walk)
-        - Sushi: Sushi Dai (15 min), Tsukiji Market
-        - Coffee: Blue Bottle (3 min), Starbucks Reserve (8 min)
-        - Attractions: Temple nearby (10 min), Museum (15 min)
-        - Shopping: Local market (5 min), Mall (20 min)
-        - Parks: Central Park (7 min walk)
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a local expert and tour guide.
-                Recommend authentic local places based on guest preferences.
-                Be concise (2-3 sentences) and include distance/time.
-
-                Local Knowledge Base:
-                {local_kb}
-
-                Consider: cuisine type, distance, price range, current time,
-                and whether places are currently open."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
-
-        return {
-            "response": assistant_message,
-            "action": "recommendations_provided",
-            "metadata": {
-                "skill": self.name,
-                "session_id": session_id,
-                "location": location,
-                "recommendation_type": "local_places"
-            }
-        }
-
-
-class ItinerarySkill:
-    """Plan day trips and itineraries."""
-
-    name = "itinerary_planning"
-    description = "Create personalized day plans and itineraries"
-    example_utterances = [
+    ],
+    system_prompt=_RECOMMENDATION_PROMPT,
+    action="recommendations_provided",
+    context_metadata={"location": ("location", _DEFAULT_LOCATION)},
+    metadata={"recommendation_type": "local_places"},
+)
+
+ITINERARY = LLMSkill(
+    name="itinerary_planning",
+    description="Create personalized day plans and itineraries",
+    example_utterances=[
         "Plan my day, I have 4 hours",
         "What should I do today?",
         "Create an itinerary for tomorrow",
         "I have half a day free, what to do?",
         "Plan a walking tour for me",
-    ]
-
-    def __init__(self):
-        pass
-
-    async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        transcription = context.get("transcription", "")
-        session_id = context.get("session_id", "default")
-
-        itinerary_kb = """
-        Popular Routes:
-        4-hour cultural tour: Temple (1h) -> Museum (1.5h) -> Local lunch (1h) -> Market (30min)
-        Half-day food tour: Breakfast spot -> Coffee -> Market tour -> Lunch
-        Walking tour: Park -> Historic district -> Shopping street -> Cafe
-        Family-friendly: Aquarium (2h) -> Park (1h) -> Kids restaurant
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a professional tour planner.
-                Create optimized itineraries based on time available and preferences.
-                Be concise but specific with timing and locations.
-
-                Route Templates:
-                {itinerary_kb}
-
-                Consider: available time, interests, walking distance,
-                meal times, and opening hours. Present as a bulleted list."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
-
-        return {
-            "response": assistant_message,
-            "action": "itinerary_created",
-            "metadata": {
-                "skill": self.name,
-                "session_id": session_id,
-                "type": "day_plan"
-            }
-        }
-
-
-class DirectionsSkill:
-    """Provide navigation and directions."""
-
-    name = "directions"
-    description = "Help guests navigate to destinations with turn-by-turn directions"
-    example_utterances = [
+    ],
+    system_prompt=_ITINERARY_PROMPT,
+    action="itinerary_created",
+    max_tokens=256,
+    metadata={"type": "day_plan"},
+)
+
+DIRECTIONS = LLMSkill(
+    name="directions",
+    description="Help guests navigate to destinations with turn-by-turn directions",
+    example_utterances=[
         "How do I get to Shibuya?",
         "Directions to the nearest subway",
         "How far is the temple?",
         "Best way to get to the airport?",
         "Walking directions to the museum",
-    ]
+    ],
+    system_prompt=_DIRECTIONS_PROMPT,
+    action="directions_provided",
+    max_tokens=160,
+    context_metadata={"from": ("hotel_location", _DEFAULT_HOTEL)},
+    metadata={"transport_mode": "walking"},
+)
 
-    def __init__(self):
-        pass
 
-    async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        transcription = context.get("transcription", "")
-        session_id = context.get("session_id", "default")
-        hotel_location = context.get("hotel_location", "the hotel")
-
-        directions_kb = """
-        Common Destinations from Hotel:
-        - Shibuya Station: 10 min walk east, or 5 min subway
-        - Nearest Subway: Exit hotel, turn right, 3 min walk
-        - Airport: 45 min by Narita Express train, or 60 min bus
-        - Temple: 10 min walk north through park
-        - Museum: 15 min walk, or 2 stops on subway line
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""You are a navigation assistant.
-                Provide clear, step-by-step directions. Be concise (2-4 sentences).
-
-                Common Routes:
-                {directions_kb}
-
-                Include: walking time, transportation options, landmarks,
-                and distance. Prefer walking for <15 min distances."""
-            },
-            {"role": "user", "content": transcription}
-        ]
-
-        assistant_message = skill_chat(messages)
+# Backward-compatible constructors; the skills are stateless singletons.
+def RecommendationSkill() -> LLMSkill:
+    """Provide local place recommendations."""
+    return RECOMMENDATION
 
-        return {
-            "response": assistant_message,
-            "action": "directions_provided",
-            "metadata": {
-                "skill": self.name,
-                "session_id": session_id,
-                "from": hotel_location,
-                "transport_mode": "walking"
-            }
-        }
+
+def ItinerarySkill() -> LLMSkill:
+    """Plan day trips and itineraries."""
+    return ITINERARY
+
+
+def DirectionsSkill() -> LLMSkill:
+    """Provide navigation and directions."""
+    return DIRECTIONS
@@ -0,0 +1,46 @@
+"""
+Fake provider responses shared by the API tests.
+"""
+
+import json
+import base64
+from dataclasses import dataclass
+
+
+# Canned audio blobs, encoded once at import
+DUMMY_AUDIO_B64 = base64.b64encode(b'test').decode('utf-8')
+TTS_AUDIO_B64 = base64.b64encode(b'madeaudio').decode('utf-8')
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass(slots=True, frozen=True)
+class FakeResponse:
+    """Minimal stand-in for requests.Response with a JSON body."""
+    payload: dict
+    status_code: int = 200
+
+    @property
+    def headers(self):
+        return _JSON_HEADERS
+
+    @property
+    def text(self):
+        return json.dumps(self.payload)
+
+    @property
+    def content(self):
+        return self.text.encode('utf-8')
+
+    def json(self):
+        return self.payload
+
+
+def http_json(payload, status=200):
+    """Fake requests.Response whose .json() returns payload."""
+    return FakeResponse(payload, status)
+
+
+def chat_json(content, status=200):
+    """Fake chat-completions response with a single assistant message."""
+    return http_json({"choices": [{"message": {"content": content}}]}, status)
@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for the NomadAI test suite.
+"""
+
+import os
+import sys
+
+# Make the repo root importable (api.index, src.skills) once per session
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    """Set fake provider credentials before any test module imports the app."""
+    if not os.environ.get('CHUTES_API_KEY'):
+        os.environ['CHUTES_API_KEY'] = 'cpk_test_key'
@@ -7,113 +7,128 @@ Tests cover:
 - Transcribe/voice-chat stubs (501)
 - Provider listing
 - Session management
+- Agent loop parallel tool calls
+- Ping fan-out and skill cache warmup
+
+Assertions are plain equality/membership checks, so pytest's assertion
+rewriting is skipped for this module: PYTEST_DONT_REWRITE
 """
 
-import json
-import os
+import time
+import threading
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-
-@pytest.fixture
-def app():
+from unittest.mock import patch
+
+from tests._fakes import DUMMY_AUDIO_B64, TTS_AUDIO_B64, http_json, chat_json
+
+# Request bodies, built once at import
+_HELLO_PAYLOAD = {'message': 'Hello!'}
+_EMPTY_PAYLOAD = {}
+_MODEL_PAYLOAD = {'message': 'Test', 'model': 'Qwen/Qwen3-32B'}
+_AUDIO_PAYLOAD = {'audio_base64': DUMMY_AUDIO_B64}
+_VOICE_PAYLOAD = {'audio_base64': DUMMY_AUDIO_B64, 'session_id': 'voice_test'}
+_TRANSLATE_PAYLOAD = {'text': 'What time is checkout?', 'target_lang': 'ja'}
+_TRANSLATE_NO_TEXT_PAYLOAD = {'target_lang': 'ja'}
+_SLIDES_PAYLOAD = {'topic': 'Tokyo'}
+_VIDEO_PAYLOAD = {'prompt': 'Tokyo sunset'}
+_RESET_PAYLOAD = {'session_id': 'reset-test'}
+_RESET_MISSING_PAYLOAD = {'session_id': 'nonexistent'}
+
+# Expected response key sets, checked with one superset comparison
+_ERROR_KEYS = frozenset({'error'})
+_CHAT_KEYS = frozenset({'success', 'response'})
+_TRANSLATE_KEYS = frozenset({'success', 'translated_text'})
+
+
+@pytest.fixture(scope='session')
+def api_module():
+    """Import api.index once per worker (CHUTES_API_KEY set in conftest)."""
+    import api.index
+    return api.index
+
+
+@pytest.fixture(scope='session')
+def app(api_module):
     """Create Flask app for testing."""
-    if 'api.index' in sys.modules:
-        del sys.modules['api.index']
-
-    with patch.dict(os.environ, {'CHUTES_API_KEY': 'cpk_test_key'}):
-        from api.index import app as flask_app
-        flask_app.config['TESTING'] = True
-        return flask_app
+    flask_app = api_module.app
+    flask_app.config['TESTING'] = True
+    return flask_app
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def client(app):
     """Create Flask test client."""
     return app.test_client()
 
 
+@pytest.fixture(scope='class', autouse=True)
+def class_post():
+    """Patch requests.post once per test class."""
+    with patch('requests.post') as m:
+        yield m
+
+
+@pytest.fixture(autouse=True)
+def mock_post(class_post):
+    """The class-scoped requests.post mock, reset before each test."""
+    class_post.reset_mock(return_value=True, side_effect=True)
+    return class_post
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions(api_module):
+    """Clear module-level conversation, rate-limit and cache state between tests."""
+    api_module.conversations.clear()
+    api_module.rate_limit_storage.clear()
+    api_module.global_rate_limit_storage.clear()
+    api_module.faq_cache.clear()
+
+
 class TestChatEndpoint:
     """Test suite for /api/chat endpoint (Chutes.ai)."""
 
-    def test_chat_endpoint_success(self, client):
+    def test_chat_endpoint_success(self, client, mock_post):
         """Test successful chat request via Chutes."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "choices": [{"message": {"content": "Hello! How can I help?"}}]
-        }
+        mock_post.return_value = chat_json("Hello! How can I help?")
 
-        with patch('requests.post', return_value=mock_resp):
-            response = client.post(
-                '/api/chat',
-                data=json.dumps({'message': 'Hello!'}),
-                content_type='application/json'
-            )
+        response = client.post('/api/chat', json=_HELLO_PAYLOAD)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
+        assert data.keys() >= _CHAT_KEYS
         assert data['success'] is True
-        assert 'response' in data
 
     def test_chat_missing_message(self, client):
         """Test chat request without required message parameter."""
-        response = client.post(
-            '/api/chat',
-            data=json.dumps({}),
-            content_type='application/json'
-        )
+        response = client.post('/api/chat', json=_EMPTY_PAYLOAD)
 
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert 'error' in data
+        data = response.get_json()
+        assert data.keys() >= _ERROR_KEYS
+        assert data['error'] == 'message required'
 
-    def test_chat_with_model_selection(self, client):
+    def test_chat_with_model_selection(self, client, mock_post):
         """Test chat with explicit model selection."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "choices": [{"message": {"content": "Response from Qwen"}}]
-        }
+        mock_post.return_value = chat_json("Response from Qwen")
 
-        with patch('requests.post', return_value=mock_resp):
-            response = client.post(
-                '/api/chat',
-                data=json.dumps({
-                    'message': 'Test',
-                    'model': 'Qwen/Qwen3-32B'
-                }),
-                content_type='application/json'
-            )
+        response = client.post('/api/chat', json=_MODEL_PAYLOAD)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
 
 
 class TestTranscribeEndpoint:
     """Test suite for /api/transcribe endpoint (Chutes STT)."""
 
-    def test_transcribe_returns_501(self, client):
+    def test_transcribe_returns_501(self, client, mock_post):
         """Transcribe returns text when STT succeeds (mocked)."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"text": "hello world"}
+        mock_post.return_value = http_json({"text": "hello world"})
 
-        with patch('requests.post', return_value=mock_resp):
-            response = client.post(
-                '/api/transcribe',
-                data=json.dumps({'audio_base64': 'dGVzdA=='}),
-                content_type='application/json'
-            )
+        response = client.post('/api/transcribe', json=_AUDIO_PAYLOAD)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert data['text'] == 'hello world'
 
@@ -121,104 +136,79 @@ class TestTranscribeEndpoint:
 class TestVoiceChatEndpoint:
     """Test suite for /api/voice-chat endpoint (STT -> LLM -> TTS)."""
 
-    def test_voice_chat_returns_501(self, client):
+    @pytest.fixture(scope='class')
+    def voice_responses(self):
+        """STT, LLM and TTS responses, built once for the class."""
+        return (
+            http_json({"text": "hello"}),
+            chat_json("Hi there!"),
+            http_json({"audio": TTS_AUDIO_B64}),
+        )
+
+    def test_voice_chat_returns_501(self, client, mock_post, voice_responses):
         """Voice chat returns combined result when all stages succeed (mocked)."""
         # Mock STT, LLM, TTS sequential calls
-        stt_resp = MagicMock(status_code=200)
-        stt_resp.json.return_value = {"text": "hello"}
-        llm_resp = MagicMock(status_code=200)
-        llm_resp.json.return_value = {"choices": [{"message": {"content": "Hi there!"}}]}
-        tts_resp = MagicMock(status_code=200)
-        tts_resp.json.return_value = {"audio": "bWFkZWF1ZGlv"}
-
-        def side_effect(*args, **kwargs):
-            url = args[0]
-            if 'audio/transcriptions' in url:
-                return stt_resp
-            if 'chat/completions' in url:
-                return llm_resp
-            if 'audio/speech' in url:
-                return tts_resp
-            return llm_resp
-
-        with patch('requests.post', side_effect=side_effect):
-            response = client.post(
-                '/api/voice-chat',
-                data=json.dumps({'audio_base64': 'dGVzdA==', 'session_id': 'voice_test'}),
-                content_type='application/json'
-            )
+        stt_resp, llm_resp, tts_resp = voice_responses
+
+        # Route by endpoint path tail: api.chutes.ai STT, llm.chutes.ai chat,
+        # Kokoro /speak (default TTS) or central /audio/speech
+        routes = {
+            'audio/transcriptions': stt_resp,
+            'chat/completions': llm_resp,
+            'audio/speech': tts_resp,
+            'speak': tts_resp,
+        }
+
+        def side_effect(url, *args, **kwargs):
+            head, _, last = url.rpartition('/')
+            return routes.get(f"{head.rpartition('/')[2]}/{last}") or routes.get(last, llm_resp)
+
+        mock_post.side_effect = side_effect
+
+        response = client.post('/api/voice-chat', json=_VOICE_PAYLOAD)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert data['transcription'] == 'hello'
         assert data['response'] == 'Hi there!'
-        assert 'audio_base64' in data
+        assert data['audio_base64'] == TTS_AUDIO_B64
 
 
 class TestTranslateEndpoint:
     """Test suite for /api/translate endpoint (prompt-based via Chutes)."""
 
-    def test_translate_success(self, client):
+    def test_translate_success(self, client, mock_post):
         """Test translation via chat model."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "choices": [{"message": {"content": "チェックアウトは何時ですか？"}}]
-        }
+        mock_post.return_value = chat_json("チェックアウトは何時ですか？")
 
-        with patch('requests.post', return_value=mock_resp):
-            response = client.post(
-                '/api/translate',
-                data=json.dumps({
-                    'text': 'What time is checkout?',
-                    'target_lang': 'ja'
-                }),
-                content_type='application/json'
-            )
+        response = client.post('/api/translate', json=_TRANSLATE_PAYLOAD)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
+        assert data.keys() >= _TRANSLATE_KEYS
         assert data['success'] is True
-        assert 'translated_text' in data
 
     def test_translate_missing_text(self, client):
         """Test translate without text parameter."""
-        response = client.post(
-            '/api/translate',
-            data=json.dumps({'target_lang': 'ja'}),
-            content_type='application/json'
-        )
+        response = client.post('/api/translate', json=_TRANSLATE_NO_TEXT_PAYLOAD)
 
         assert response.status_code == 400
+        data = response.get_json()
+        assert data.keys() >= _ERROR_KEYS
+        assert data['error'] == 'text required'
 
 
-class TestSlidesEndpoint:
-    """Test suite for /api/generate-slides (501 stub)."""
-
-    def test_slides_returns_501(self, client):
-        """Slides generation is not available — returns 501."""
-        response = client.post(
-            '/api/generate-slides',
-            data=json.dumps({'topic': 'Tokyo'}),
-            content_type='application/json'
-        )
-
-        assert response.status_code == 501
-
-
-class TestVideoEndpoint:
-    """Test suite for /api/generate-video (501 stub)."""
-
-    def test_video_returns_501(self, client):
-        """Video generation is not available — returns 501."""
-        response = client.post(
-            '/api/generate-video',
-            data=json.dumps({'prompt': 'Tokyo sunset'}),
-            content_type='application/json'
-        )
+class TestStubEndpoints:
+    """Test suite for generation endpoints that are not available (501 stubs)."""
 
-        assert response.status_code == 501
+    @pytest.mark.parametrize('endpoint, payload', [
+        ('/api/generate-slides', _SLIDES_PAYLOAD),
+        ('/api/generate-video', _VIDEO_PAYLOAD),
+    ], ids=['slides', 'video'])
+    def test_returns_501(self, client, endpoint, payload):
+        """Slides and video generation are not available — return 501."""
+        assert client.post(endpoint, json=payload).status_code == 501
 
 
 class TestProvidersEndpoint:
@@ -229,7 +219,7 @@ class TestProvidersEndpoint:
         response = client.get('/api/providers')
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'chutes' in data['providers']
         assert 'zai' not in data['providers']
         assert data['active_provider'] == 'chutes'
@@ -238,29 +228,93 @@ class TestProvidersEndpoint:
 class TestSessionManagement:
     """Test suite for conversation session management."""
 
-    def test_reset_conversation(self, client):
-        """Test resetting conversation history for a session."""
-        response = client.post(
-            '/api/reset',
-            data=json.dumps({'session_id': 'reset-test'}),
-            content_type='application/json'
-        )
+    @pytest.mark.parametrize('payload, existing', [
+        (_RESET_PAYLOAD, True),
+        (_RESET_MISSING_PAYLOAD, False),
+    ], ids=['existing', 'nonexistent'])
+    def test_reset_session(self, client, api_module, payload, existing):
+        """Resetting clears an existing session and is a no-op for unknown ones."""
+        session_id = payload['session_id']
+        if existing:
+            api_module.conversations[session_id] = {"messages": [{"role": "user", "content": "hi"}]}
+
+        response = client.post('/api/reset', json=payload)
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
+        assert session_id not in api_module.conversations
+
+
+class TestAgentLoop:
+    """Test suite for agent_loop tool calling."""
+
+    def test_parallel_tool_calls_run_and_keep_order(self, api_module, mock_post):
+        """Every tool call runs on the pool; tool messages follow tool_call order."""
+        tool_calls = [
+            {"id": "call_slow", "type": "function",
+             "function": {"name": "local_recommendations", "arguments": '{"query": "ramen"}'}},
+            {"id": "call_fast", "type": "function",
+             "function": {"name": "directions", "arguments": '{"destination": "Shibuya"}'}},
+        ]
+        mock_post.side_effect = [
+            http_json({"choices": [{"message": {"role": "assistant", "content": None,
+                                                "tool_calls": tool_calls}}]}),
+            chat_json("Ichiran, ten minutes away."),
+        ]
+        threads = {}
+
+        def execute_tool(tool_name, arguments, session_id):
+            # The first call finishes last, so completion order differs from call order
+            if tool_name == "local_recommendations":
+                time.sleep(0.05)
+            threads[tool_name] = threading.current_thread().name
+            return f"{tool_name} result"
+
+        with patch.object(api_module, '_execute_tool', side_effect=execute_tool):
+            reply = api_module.agent_loop("Find ramen and tell me how to get to Shibuya", "tools-test")
+
+        assert reply == "Ichiran, ten minutes away."
+        assert all(name.startswith("tool") for name in threads.values())
+        assert threads.keys() == {"local_recommendations", "directions"}
+        tool_messages = [m for m in api_module.get_session_messages("tools-test") if m.get("role") == "tool"]
+        assert [(m["tool_call_id"], m["content"]) for m in tool_messages] == [
+            ("call_slow", "local_recommendations result"),
+            ("call_fast", "directions result"),
+        ]
+
+
+class TestPingEndpoint:
+    """Test suite for /api/ping."""
+
+    def test_probes_every_model_in_order(self, client, mock_post):
+        """Each test model is probed once; results keep the model list order."""
+        mock_post.return_value = chat_json("pong")
+
+        response = client.get('/api/ping')
+
+        assert response.status_code == 200
+        tests = response.get_json()['providers']['chutes']['tests']
+        assert [t['model'] for t in tests] == ["deepseek-ai/DeepSeek-V3-0324", "Qwen/Qwen3-32B"]
+        assert all(t['status'] == 'ok' and t['reply'] == 'pong' for t in tests)
+        assert mock_post.call_count == 2
+
 
-    def test_reset_nonexistent_session(self, client):
-        """Test resetting a session that doesn't exist."""
-        response = client.post(
-            '/api/reset',
-            data=json.dumps({'session_id': 'nonexistent'}),
-            content_type='application/json'
+class TestSkillCacheWarmup:
+    """Test suite for _warmup_skills()."""
+
+    def test_warmup_answers_every_example_utterance(self, api_module):
+        """Each warmable skill's example utterances go through its cached chat."""
+        from src.skills import sightseeing
+
+        expected = sorted(
+            u for skill in api_module.SKILLS if hasattr(skill, 'warmup') for u in skill.example_utterances
         )
+        with patch.object(sightseeing, 'cached_skill_chat', return_value="Answer.") as mock_chat:
+            api_module._warmup_skills()
 
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
+        assert expected
+        assert sorted(call.args[1][-1]['content'] for call in mock_chat.call_args_list) == expected
 
 
 if __name__ == '__main__':
@@ -0,0 +1,140 @@
+"""
+Tests for the shared skill chat provider (src/skills/chat_provider.py).
+
+Tests cover:
+- Response parsing
+- Streaming (SSE) responses
+- Coalescing of identical in-flight requests
+"""
+
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.skills import chat_provider
+from tests._fakes import chat_json
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a hotel IT support assistant."},
+    {"role": "user", "content": "What's the WiFi password?"},
+]
+
+
+def _sse_response(*deltas):
+    lines = [f'data: {{"choices": [{{"delta": {{"content": {json.dumps(d)}}}}}]}}' for d in deltas]
+    resp = MagicMock(status_code=200)
+    resp.iter_lines.return_value = [*lines, "", "data: [DONE]"]
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def api_key():
+    """Configure a fake Chutes key for every test."""
+    with patch.object(chat_provider, 'CHUTES_API_KEY', 'cpk_test_key'):
+        yield
+
+
+class TestSkillChat:
+    """Test suite for skill_chat()."""
+
+    def test_strips_think_blocks(self):
+        """Reasoning blocks are removed from the returned text."""
+        resp = chat_json("<think>pondering</think> Welcome2026!")
+        with patch.object(chat_provider._SESSION, 'post', return_value=resp):
+            assert chat_provider.skill_chat(MESSAGES) == "Welcome2026!"
+
+    def test_default_max_tokens_cap(self):
+        """Skill calls are capped at SKILL_MAX_TOKENS unless overridden."""
+        with patch.object(chat_provider._SESSION, 'post', return_value=chat_json("ok")) as mock_post:
+            chat_provider.skill_chat(MESSAGES)
+            chat_provider.skill_chat(MESSAGES, max_tokens=256)
+
+        sent = [c.kwargs['json']['max_tokens'] for c in mock_post.call_args_list]
+        assert sent == [chat_provider.SKILL_MAX_TOKENS, 256]
+
+    def test_extra_headers_forwarded(self):
+        """Caller-supplied headers are sent alongside auth headers."""
+        with patch.object(chat_provider._SESSION, 'post', return_value=chat_json("ok")) as mock_post:
+            chat_provider.skill_chat(MESSAGES, extra_headers=chat_provider.PROMPT_CACHE_HEADERS)
+
+        headers = mock_post.call_args.kwargs['headers']
+        assert headers['x-prompt-cache'] == '1'
+        assert headers['Authorization'] == 'Bearer cpk_test_key'
+
+    def test_http_error_raises(self):
+        """Non-200 responses raise RuntimeError."""
+        resp = MagicMock(status_code=500, text="boom")
+        resp.json.return_value = {"error": {"message": "boom"}}
+        with patch.object(chat_provider._SESSION, 'post', return_value=resp):
+            with pytest.raises(RuntimeError):
+                chat_provider.skill_chat(MESSAGES)
+
+    def test_identical_concurrent_requests_are_coalesced(self):
+        """A duplicate request joins the in-flight call instead of posting again."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_post(*args, **kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            return chat_json("NomadAI-Guest / Welcome2026!")
+
+        results = []
+        with patch.object(chat_provider._SESSION, 'post', side_effect=slow_post) as mock_post:
+            leader = threading.Thread(target=lambda: results.append(chat_provider.skill_chat(MESSAGES)))
+            leader.start()
+            assert entered.wait(timeout=5)
+
+            threading.Timer(0.1, release.set).start()
+            results.append(chat_provider.skill_chat(MESSAGES))
+            leader.join(timeout=5)
+
+        assert mock_post.call_count == 1
+        assert results == ["NomadAI-Guest / Welcome2026!"] * 2
+        assert chat_provider._INFLIGHT == {}
+
+    def test_requests_to_different_chutes_are_not_coalesced(self):
+        """The same request sent to another chute posts on its own."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_post(url, **kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            return chat_json(url)
+
+        results = []
+        with patch.object(chat_provider._SESSION, 'post', side_effect=slow_post) as mock_post:
+            leader = threading.Thread(target=lambda: results.append(chat_provider.skill_chat(MESSAGES)))
+            leader.start()
+            assert entered.wait(timeout=5)
+
+            threading.Timer(0.1, release.set).start()
+            other = chat_provider.skill_chat(MESSAGES, slug="chutes-other-model")
+            leader.join(timeout=5)
+
+        assert mock_post.call_count == 2
+        assert "chutes-other-model" in other
+        assert "chutes-other-model" not in results[0]
+
+
+class TestSkillChatStream:
+    """Test suite for skill_chat_stream()."""
+
+    def test_yields_content_deltas(self):
+        """Content deltas are yielded in order and the request asks for SSE."""
+        resp = _sse_response("Take the ", "Narita Express.")
+        with patch.object(chat_provider._SESSION, 'post', return_value=resp) as mock_post:
+            chunks = list(chat_provider.skill_chat_stream(MESSAGES))
+
+        assert chunks == ["Take the ", "Narita Express."]
+        assert mock_post.call_args.kwargs['json']['stream'] is True
+        resp.close.assert_called_once()
+
+    def test_strips_think_blocks_across_chunks(self):
+        """Reasoning spans are dropped even when tags straddle chunks."""
+        resp = _sse_response("<thi", "nk>pondering</th", "ink>\n\nWelcome", "2026!")
+        with patch.object(chat_provider._SESSION, 'post', return_value=resp):
+            assert "".join(chat_provider.skill_chat_stream(MESSAGES)) == "Welcome2026!"
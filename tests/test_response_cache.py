@@ -0,0 +1,146 @@
+"""
+Tests for the skill response cache (src/skills/response_cache.py).
+
+Tests cover:
+- Query normalization
+- Exact-match and near-duplicate hits, TTL expiry and LRU eviction
+- Semantic lookups
+- cached_skill_chat() wiring
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.skills import response_cache as rc
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a local expert and tour guide."},
+    {"role": "user", "content": "Where's good ramen?"},
+]
+
+
+@pytest.fixture
+def cache():
+    """Fresh cache instance per test."""
+    return rc.ResponseCache(max_size=2, ttl=60)
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_normalize_query(self):
+        """Case, punctuation and whitespace differences are ignored."""
+        assert rc.normalize_query("  Where's   good RAMEN?! ") == "wheres good ramen"
+
+    def test_exact_hit_after_set(self, cache):
+        """A normalized repeat of a cached query is a hit."""
+        cache.set("local_recommendations", "Where's good ramen?", "Try Ichiran.")
+        assert cache.get("local_recommendations", "where's good ramen") == "Try Ichiran."
+        assert cache.get("directions", "where's good ramen") is None
+        assert cache.get_stats()["hits"] == 1
+
+    def test_near_duplicate_is_fuzzy_hit(self, cache):
+        """A query within a small edit distance reuses the cached answer."""
+        cache.set("wifi", "how do i connect to the hotel wifi network", "Use NomadAI-Guest.")
+        assert cache.get("wifi", "how do i connect to the hotels wifi network") == "Use NomadAI-Guest."
+        assert cache.get("wifi", "how do i print a document") is None
+        assert cache.get_stats()["fuzzy_hits"] == 1
+
+    def test_spacing_and_plural_variants_are_fuzzy_hits(self, cache):
+        """Spacing and trailing-s variants of the same words share an answer."""
+        cache.set("wifi", "what is the wi fi password", "guest1234")
+        assert cache.get("wifi", "what is the wifi passwords") == "guest1234"
+        assert cache.get_stats()["fuzzy_hits"] == 1
+
+    @pytest.mark.parametrize('cached, query', [
+        ("best coffee shop near the north exit of the station",
+         "best coffee shop near the south exit of the station"),
+        ("quiet bars on the east side", "quiet bars on the west side"),
+    ], ids=['north-south', 'east-west'])
+    def test_one_word_apart_is_miss(self, cache, cached, query):
+        """Queries differing in one meaningful word never share an answer, however long."""
+        cache.set("local_recommendations", cached, "North exit answer.")
+        assert cache.get("local_recommendations", query) is None
+        assert cache.get_stats()["fuzzy_hits"] == 0
+
+    def test_near_duplicate_with_different_number_is_miss(self, cache):
+        """Queries that differ only in a number never share an answer."""
+        cache.set("itinerary", "Plan my day, I have 4 hours", "Four-hour plan.")
+        cache.set("room_service", "send towels to room 101", "On the way to 101.")
+        assert cache.get("itinerary", "Plan my day, I have 5 hours") is None
+        assert cache.get("room_service", "send towels to room 102") is None
+        assert cache.get_stats()["fuzzy_hits"] == 0
+
+    def test_expired_entry_is_miss(self, cache):
+        """Entries past their TTL are dropped."""
+        cache.set("directions", "airport?", "Narita Express.")
+        with patch.object(rc.time, 'time', return_value=rc.time.time() + 61):
+            assert cache.get("directions", "airport?") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted at capacity."""
+        cache.set("s", "a", "A")
+        cache.set("s", "b", "B")
+        cache.get("s", "a")
+        cache.set("s", "c", "C")
+        assert cache.get("s", "b") is None
+        assert cache.get("s", "a") == "A"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_semantic_lookup_threshold(self, cache):
+        """Only embeddings above the cosine threshold are reused."""
+        cache.set("s", "where is ramen", "Ichiran.", embedding=[1.0, 0.0])
+        assert cache.get_similar("s", [0.99, 0.141]) == "Ichiran."
+        assert cache.get_similar("s", [0.6, 0.8]) is None
+        assert cache.get_similar("other", [1.0, 0.0]) is None
+
+
+class TestCachedSkillChat:
+    """Test suite for cached_skill_chat()."""
+
+    def test_repeat_query_skips_llm(self):
+        """The second identical query is served from the cache."""
+        with patch.object(rc, 'response_cache', rc.ResponseCache()), \
+             patch.object(rc, 'skill_chat', return_value="Try Ichiran.") as mock_chat:
+            first = rc.cached_skill_chat("local_recommendations", MESSAGES, max_tokens=160)
+            second = rc.cached_skill_chat("local_recommendations", MESSAGES, max_tokens=160)
+
+        assert first == second == "Try Ichiran."
+        mock_chat.assert_called_once_with(MESSAGES, max_tokens=160)
+
+    def test_semantic_hit_is_not_a_miss(self):
+        """A semantic hit counts once, as a hit; a miss is counted after every tier misses."""
+        cache = rc.ResponseCache(semantic=True)
+        cache.set("local_recommendations", "Where can I get ramen?", "Try Ichiran.", embedding=[1.0, 0.0])
+        embeddings = iter([[1.0, 0.0], [0.0, 1.0]])
+        with patch.object(rc, 'response_cache', cache), \
+             patch.object(rc, '_embed', side_effect=lambda query: next(embeddings)), \
+             patch.object(rc, 'skill_chat', return_value="Take the Ginza line.") as mock_chat:
+            hit = rc.cached_skill_chat("local_recommendations", MESSAGES)
+            miss = rc.cached_skill_chat("local_recommendations", [{"role": "user", "content": "How do I get to Ueno?"}])
+
+        assert (hit, miss) == ("Try Ichiran.", "Take the Ginza line.")
+        mock_chat.assert_called_once()
+        stats = cache.get_stats()
+        assert (stats["semantic_hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_empty_answer_is_not_cached(self):
+        """An empty completion is returned but the next call retries the LLM."""
+        with patch.object(rc, 'response_cache', rc.ResponseCache()), \
+             patch.object(rc, 'skill_chat', side_effect=["", "Try Ichiran."]) as mock_chat:
+            first = rc.cached_skill_chat("local_recommendations", MESSAGES)
+            second = rc.cached_skill_chat("local_recommendations", MESSAGES)
+
+        assert (first, second) == ("", "Try Ichiran.")
+        assert mock_chat.call_count == 2
+
+    def test_empty_stream_is_not_cached(self):
+        """A stream that yields nothing leaves the cache empty."""
+        cache = rc.ResponseCache()
+        with patch.object(rc, 'response_cache', cache), \
+             patch.object(rc, 'skill_chat_stream', return_value=iter([" ", ""])):
+            assert "".join(rc.cached_skill_chat_stream("local_recommendations", MESSAGES)).strip() == ""
+
+        assert cache.get_stats()["size"] == 0
@@ -0,0 +1,146 @@
+"""
+Tests for the sightseeing skills (src/skills/sightseeing.py).
+
+Tests cover:
+- Backward-compatible skill constructors
+- Result and metadata shape per skill
+- Filler bypass
+- Streaming onto a context queue (cache hit and miss)
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.skills import response_cache as rc
+from src.skills import sightseeing
+from src.skills.sightseeing import (
+    RECOMMENDATION, ITINERARY, DIRECTIONS,
+    RecommendationSkill, ItinerarySkill, DirectionsSkill,
+)
+
+
+def run_skill(skill, context, with_queue=False):
+    """Execute a skill; with_queue also returns everything pushed up to the end sentinel."""
+    async def go():
+        if not with_queue:
+            return await skill.execute(context), None
+        queue = asyncio.Queue()
+        result = await skill.execute({**context, "stream_queue": queue})
+        items = []
+        while not items or items[-1] is not None:
+            items.append(await asyncio.wait_for(queue.get(), timeout=5))
+        assert queue.empty()
+        return result, items
+    return asyncio.run(go())
+
+
+@pytest.fixture
+def fresh_cache():
+    """Isolated response cache so hits and misses are deterministic."""
+    with patch.object(rc, 'response_cache', rc.ResponseCache()):
+        yield
+
+
+class TestSkillConstructors:
+    """Test the backward-compatible constructor functions."""
+
+    @pytest.mark.parametrize('constructor, skill', [
+        (RecommendationSkill, RECOMMENDATION),
+        (ItinerarySkill, ITINERARY),
+        (DirectionsSkill, DIRECTIONS),
+    ], ids=['recommendation', 'itinerary', 'directions'])
+    def test_returns_singleton(self, constructor, skill):
+        """Each constructor returns the shared skill instance."""
+        assert constructor() is skill
+
+
+class TestSkillResult:
+    """Test result shape against the original per-skill classes."""
+
+    @pytest.mark.parametrize('skill, action, metadata', [
+        (RECOMMENDATION, 'recommendations_provided',
+         {'location': 'the area', 'recommendation_type': 'local_places'}),
+        (ITINERARY, 'itinerary_created', {'type': 'day_plan'}),
+        (DIRECTIONS, 'directions_provided', {'from': 'the hotel', 'transport_mode': 'walking'}),
+    ], ids=['recommendation', 'itinerary', 'directions'])
+    def test_result_shape(self, skill, action, metadata):
+        """Response, action and metadata match the original classes, plus sentences."""
+        with patch.object(sightseeing, 'cached_skill_chat', return_value="Go left. Then right.") as mock_chat:
+            result, _ = run_skill(skill, {"transcription": "Somewhere to go?", "session_id": "s1"})
+
+        assert result == {
+            "response": "Go left. Then right.",
+            "action": action,
+            "metadata": {
+                "skill": skill.name,
+                "session_id": "s1",
+                **metadata,
+                "sentences": ["Go left.", "Then right."],
+            },
+        }
+        assert mock_chat.call_args.args[0] == skill.name
+
+    def test_context_metadata_overrides_default(self):
+        """Context values replace the metadata defaults."""
+        with patch.object(sightseeing, 'cached_skill_chat', return_value="Ten minutes."):
+            result, _ = run_skill(DIRECTIONS, {"transcription": "How far is the temple?",
+                                               "hotel_location": "Shinjuku"})
+
+        assert result["metadata"]["from"] == "Shinjuku"
+        assert result["metadata"]["session_id"] == "default"
+
+
+class TestFillerBypass:
+    """Test that filler utterances skip the LLM."""
+
+    def test_bypass_pushes_canned_text_and_sentinel(self):
+        """Filler gets the canned reply on the queue, then None, with no LLM call."""
+        with patch.object(sightseeing, 'cached_skill_chat_stream') as mock_stream:
+            result, items = run_skill(RECOMMENDATION, {"transcription": "Thanks!"}, with_queue=True)
+
+        mock_stream.assert_not_called()
+        assert items == [sightseeing._FILLER_RESPONSE, None]
+        assert result["action"] == "skill_bypassed"
+        assert result["metadata"]["sentences"] == [sightseeing._FILLER_RESPONSE]
+
+    @pytest.mark.parametrize('skill, transcription', [
+        (DIRECTIONS, "Zoo"),
+        (DIRECTIONS, "浅草"),
+        (RECOMMENDATION, "bar"),
+        (RECOMMENDATION, "寿司"),
+    ])
+    def test_short_requests_reach_llm(self, skill, transcription):
+        """Short destinations and queries are not filler."""
+        with patch.object(sightseeing, 'cached_skill_chat', return_value="This way.") as mock_chat:
+            result, _ = run_skill(skill, {"transcription": transcription})
+
+        mock_chat.assert_called_once()
+        assert result["action"] != "skill_bypassed"
+
+
+class TestStreaming:
+    """Test streaming onto context['stream_queue']."""
+
+    def test_miss_streams_chunks_then_hit_replays_answer(self, fresh_cache):
+        """A miss pushes each chunk; a repeat is one cached chunk; both end with None."""
+        context = {"transcription": "Where's good ramen?"}
+        with patch.object(rc, 'skill_chat_stream', return_value=iter(["Try ", "Ichiran."])) as mock_stream:
+            miss, miss_items = run_skill(RECOMMENDATION, context, with_queue=True)
+            hit, hit_items = run_skill(RECOMMENDATION, context, with_queue=True)
+
+        mock_stream.assert_called_once()
+        assert miss_items == ["Try ", "Ichiran.", None]
+        assert hit_items == ["Try Ichiran.", None]
+        assert miss["response"] == hit["response"] == "Try Ichiran."
+
+    def test_sentinel_pushed_on_stream_error(self, fresh_cache):
+        """A failing stream still ends the queue with None before the error propagates."""
+        async def go():
+            queue = asyncio.Queue()
+            with pytest.raises(RuntimeError):
+                await RECOMMENDATION.execute({"transcription": "Where's good ramen?", "stream_queue": queue})
+            return await asyncio.wait_for(queue.get(), timeout=5)
+
+        with patch.object(rc, 'skill_chat_stream', side_effect=RuntimeError("boom")):
+            assert asyncio.run(go()) is None
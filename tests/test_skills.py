@@ -9,13 +9,63 @@ Tests cover:
 """
 
 import re
+import sys
+import bisect
+import itertools
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from abc import ABC, abstractmethod
+from types import MappingProxyType
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Protocol
 
+# Runs of word characters: exactly the spans a \b...\b intent match can start and end on
+_WORD_RE = re.compile(r'\w+')
+_ROUTE_CACHE_SIZE = 1024
+_END = None  # trie key holding the skill indices whose phrase ends at a node
+_EMPTY_CONTEXT = MappingProxyType({})  # shared read-only context when none is given
 
-class SkillBase(ABC):
-    """Base class for all NomadAI skills."""
+
+def _words(text: str) -> Optional[tuple]:
+    """
+    Casefolded runs of word characters in text, or None when they can't stand
+    in for re.IGNORECASE: casefold() splits a run ('İ' becomes 'i' plus a
+    combining dot), or the text has dotless 'ı', which the regex equates with 'i'.
+    """
+    words = tuple(_WORD_RE.findall(text.casefold()))
+    if 'ı' in text or words != tuple(word.casefold() for word in _WORD_RE.findall(text)):
+        return None
+    return words
+
+
+class RouteResult(NamedTuple):
+    """Outcome of IntentRouter.route(); use _asdict() where a dict is needed."""
+    skill: Optional[str]
+    response: Optional[str]
+    confidence: float
+    success: bool
+    error: Optional[str] = None
+
+
+_NO_MATCH = RouteResult(None, None, 0.0, False, 'No matching skill found')
+
+# Failures a skill may legitimately report; anything else is a bug and propagates
+SkillError = (RuntimeError, ValueError, KeyError, TimeoutError)
+
+
+class SkillHandler(Protocol):
+    """Signature of a skill's handle method, as cached by IntentRouter."""
+
+    def __call__(self, user_input: str, context: dict = None) -> str: ...
+
+
+class SkillBase:
+    """
+    Base class for all NomadAI skills; subclasses override handle().
+
+    Instances are slotted. Subclasses should declare ``__slots__`` too (``()``
+    if they add no attributes), otherwise they regain a per-instance __dict__.
+    """
+
+    __slots__ = ('name', 'intents', 'enabled', '_pattern', '_intent_words', '_unindexed')
 
     def __init__(self, name: str, intents: list):
         """
@@ -28,30 +78,35 @@ class SkillBase(ABC):
         self.name = name
         self.intents = intents
         self.enabled = True
+        # One word-bounded alternation of all intents, compiled once per skill;
+        # (?!) never matches, so a skill without intents matches nothing
+        alternation = '|'.join(re.escape(intent) for intent in intents) or '(?!)'
+        self._pattern = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+        # Casefolded word tuples for IntentRouter's phrase trie; interned so
+        # every skill sharing a word shares one key object
+        self._intent_words = tuple(
+            tuple(map(sys.intern, words)) for words in map(_words, intents) if words
+        )
+        # An intent without word characters (e.g. "?!"), or one casefolding
+        # can't tokenize (e.g. "İstanbul"), has no trie path
+        self._unindexed = len(self._intent_words) < len(intents)
 
-    @abstractmethod
     def handle(self, user_input: str, context: dict = None) -> str:
         """
         Handle user input and return response.
 
         Args:
             user_input: The user's message
-            context: Optional context dict with session info
+            context: Optional context dict with session info (read-only)
 
         Returns:
             Response string
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement handle()")
 
     def matches(self, user_input: str) -> bool:
         """Check if this skill can handle the input using word boundary matching."""
-        user_lower = user_input.lower()
-        for intent in self.intents:
-            # Use word boundary matching to avoid false positives
-            pattern = r'\b' + re.escape(intent.lower()) + r'\b'
-            if re.search(pattern, user_lower):
-                return True
-        return False
+        return self._pattern.search(user_input) is not None
 
 
 class IntentRouter:
@@ -60,47 +115,154 @@ class IntentRouter:
     def __init__(self):
         """Initialize router."""
         self.skills = {}
+        self._order = []  # sorted (priority, registration seq, name)
+        self._seq = itertools.count()
+        # Parallel per-skill lists in routing (priority) order
+        self._ordered = []
+        self._names = []
+        self._handlers: list[SkillHandler] = []  # bound skill.handle methods
+        self._trie = {}  # word trie over all intent phrases
+        self._unindexed = ()  # skills with an intent the trie can't index
+        self._route_cache = OrderedDict()  # raw input: matching skill indices
+        self._dirty = True
+
+    def register(self, skill: SkillBase, priority: int = 0) -> None:
+        """
+        Register a skill.
 
-    def register(self, skill: SkillBase) -> None:
-        """Register a skill."""
+        Args:
+            skill: Skill to register (replaces any skill with the same name)
+            priority: Lower values are tried first; ties go to the earlier registration
+        """
+        if skill.name in self.skills:
+            self._order = [entry for entry in self._order if entry[2] != skill.name]
         self.skills[skill.name] = skill
-
-    def route(self, user_input: str, context: dict = None) -> dict:
+        bisect.insort(self._order, (priority, next(self._seq), skill.name))
+        self._dirty = True
+
+    def _build_index(self) -> None:
+        """Build a word trie of every intent phrase, across all skills."""
+        self._ordered = [self.skills[name] for _, _, name in self._order]
+        self._names = [skill.name for skill in self._ordered]
+        self._handlers = [skill.handle for skill in self._ordered]
+        trie = {}
+        for i, skill in enumerate(self._ordered):
+            for words in skill._intent_words:
+                node = trie
+                for word in words:
+                    node = node.setdefault(word, {})
+                node.setdefault(_END, []).append(i)
+        self._trie = trie
+        self._unindexed = tuple(i for i, skill in enumerate(self._ordered) if skill._unindexed)
+        self._route_cache.clear()
+        self._dirty = False
+
+    def _candidates(self, user_input: str) -> tuple:
+        """
+        Indices of skills whose matches() accepts the input, ascending.
+
+        Walks the intent trie from each word of the input, so phrases sharing
+        a prefix ("what", "what time") are matched together and a walk stops
+        at the first word no phrase continues with. Any word-bounded intent
+        match contains the intent's word runs as whole, consecutive input
+        words, so the walk finds a superset of the matching skills; each is
+        then confirmed with matches(), keeping routing identical to it for
+        intents with punctuation ("wi-fi", "c++"). Input _words() can't
+        tokenize skips the walk and confirms every skill.
+        Results are LRU-cached per input and ignore enabled flags, so toggling
+        a skill never invalidates the cache.
+        """
+        cached = self._route_cache.get(user_input)
+        if cached is not None:
+            self._route_cache.move_to_end(user_input)
+            return cached
+
+        # Casefold once per call (not per skill)
+        words = _words(user_input)
+        ordered = self._ordered
+        if words is None:
+            found = range(len(ordered))  # the trie can't be trusted; confirm every skill
+        else:
+            found = set(self._unindexed)
+            for pos in range(len(words)):
+                node = self._trie
+                for end in range(pos, len(words)):
+                    node = node.get(words[end])
+                    if node is None:
+                        break
+                    found.update(node.get(_END, ()))
+        candidates = tuple(i for i in sorted(found) if ordered[i].matches(user_input))
+
+        self._route_cache[user_input] = candidates
+        if len(self._route_cache) > _ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        return candidates
+
+    def _match(self, user_input: str) -> int:
+        """Index of the highest-priority enabled skill matching the input, or -1."""
+        ordered = self._ordered
+        for i in self._candidates(user_input):
+            if ordered[i].enabled:
+                return i
+        return -1
+
+    def route(self, user_input: str, context: dict = None) -> RouteResult:
         """
         Route input to matching skill.
 
         Returns:
-            Dict with matched skill, response, confidence
+            RouteResult with matched skill, response, confidence
+        """
+        if self._dirty:
+            self._build_index()
+        if context is None:
+            context = _EMPTY_CONTEXT
+        return self._dispatch(self._match(user_input), user_input, context)
+
+    def route_many(self, inputs: list, contexts: list = None) -> list:
         """
-        context = context or {}
-
-        # Find matching skill
-        for skill_name, skill in self.skills.items():
-            if skill.enabled and skill.matches(user_input):
-                try:
-                    response = skill.handle(user_input, context)
-                    return {
-                        'skill': skill_name,
-                        'response': response,
-                        'confidence': 1.0,
-                        'success': True
-                    }
-                except Exception as e:
-                    return {
-                        'skill': skill_name,
-                        'response': None,
-                        'error': str(e),
-                        'success': False
-                    }
+        Route a batch of inputs, building the intent trie at most once.
+
+        Args:
+            inputs: User messages, routed in order
+            contexts: Optional per-input context dicts (same length as inputs)
+
+        Returns:
+            List of RouteResult, one per input
+
+        Raises:
+            ValueError: If contexts is given with a different length than inputs
+        """
+        if contexts is None:
+            contexts = [None] * len(inputs)
+        elif len(contexts) != len(inputs):
+            raise ValueError(f"Got {len(contexts)} contexts for {len(inputs)} inputs")
+        if self._dirty:
+            self._build_index()
+        return [
+            self._dispatch(self._match(user_input), user_input,
+                           _EMPTY_CONTEXT if context is None else context)
+            for user_input, context in zip(inputs, contexts)
+        ]
+
+    def _dispatch(self, i: int, user_input: str, context: dict) -> RouteResult:
+        """Call the handler of skill i (-1 for no match) and wrap the outcome."""
+        if i >= 0:
+            skill_name = self._names[i]
+            try:
+                response = self._handlers[i](user_input, context)
+                return RouteResult(skill_name, response, 1.0, True)
+            except SkillError as e:
+                return RouteResult(skill_name, None, 0.0, False, str(e))
 
         # No skill matched
-        return {
-            'skill': None,
-            'response': None,
-            'confidence': 0.0,
-            'success': False,
-            'error': 'No matching skill found'
-        }
+        return _NO_MATCH
+
+    def rebind(self, name: str) -> None:
+        """Refresh the cached handler after reassigning a registered skill's handle."""
+        skill = self.skills[name]
+        if not self._dirty:
+            self._handlers[self._names.index(name)] = skill.handle
 
     def get_skill(self, name: str) -> SkillBase:
         """Get skill by name."""
@@ -123,6 +285,8 @@ def skill_router():
 def mock_weather_skill():
     """Create a mock weather skill."""
     class WeatherSkill(SkillBase):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__('weather', ['weather', 'temperature', 'forecast', 'rain'])
 
@@ -136,6 +300,8 @@ def mock_weather_skill():
 def mock_time_skill():
     """Create a mock time skill."""
     class TimeSkill(SkillBase):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__('time', ['time', 'what time', 'clock'])
 
@@ -149,6 +315,8 @@ def mock_time_skill():
 def mock_calculator_skill():
     """Create a mock calculator skill."""
     class CalculatorSkill(SkillBase):
+        __slots__ = ()
+
         def __init__(self):
             super().__init__('calculator', ['calculate', 'math', 'plus', 'minus', 'multiply'])
 
@@ -187,6 +355,10 @@ class TestSkillBaseInterface:
         assert mock_weather_skill.matches("WEATHER") is True
         assert mock_weather_skill.matches("Weather") is True
 
+    def test_skill_is_slotted(self, mock_weather_skill):
+        """Skills declaring __slots__ carry no per-instance __dict__."""
+        assert not hasattr(mock_weather_skill, '__dict__')
+
     def test_skill_enable_disable(self, mock_weather_skill):
         """Test enabling/disabling a skill."""
         assert mock_weather_skill.enabled is True
@@ -213,18 +385,18 @@ class TestIntentRouting:
 
         result = skill_router.route("What's the weather?")
 
-        assert result['success'] is True
-        assert result['skill'] == 'weather'
-        assert result['response'] == "The weather is sunny with a high of 72 degrees."
-        assert result['confidence'] == 1.0
+        assert result.success is True
+        assert result.skill == 'weather'
+        assert result.response == "The weather is sunny with a high of 72 degrees."
+        assert result.confidence == 1.0
 
     def test_route_no_matching_skill(self, skill_router):
         """Test routing when no skill matches."""
         result = skill_router.route("Tell me a joke")
 
-        assert result['success'] is False
-        assert result['skill'] is None
-        assert 'error' in result
+        assert result.success is False
+        assert result.skill is None
+        assert result.error is not None
 
     def test_route_multiple_skills(self, skill_router, mock_weather_skill, mock_time_skill):
         """Test routing with multiple registered skills."""
@@ -233,11 +405,11 @@ class TestIntentRouting:
 
         # Route to weather skill
         weather_result = skill_router.route("What's the weather?")
-        assert weather_result['skill'] == 'weather'
+        assert weather_result.skill == 'weather'
 
         # Route to time skill
         time_result = skill_router.route("What time is it?")
-        assert time_result['skill'] == 'time'
+        assert time_result.skill == 'time'
 
     def test_route_with_context(self, skill_router, mock_weather_skill):
         """Test routing with context information."""
@@ -246,12 +418,14 @@ class TestIntentRouting:
         context = {'session_id': 'test-session', 'user_id': 'user-1'}
         result = skill_router.route("Tell me about the weather", context)
 
-        assert result['success'] is True
-        assert result['skill'] == 'weather'
+        assert result.success is True
+        assert result.skill == 'weather'
 
     def test_route_skill_error_handling(self, skill_router):
         """Test routing handles skill errors gracefully."""
         class ErrorSkill(SkillBase):
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__('error', ['error'])
 
@@ -263,9 +437,122 @@ class TestIntentRouting:
 
         result = skill_router.route("error test")
 
-        assert result['success'] is False
-        assert result['response'] is None
-        assert 'error' in result
+        assert result.success is False
+        assert result.response is None
+        assert result.error is not None
+
+    def test_route_propagates_unexpected_errors(self, skill_router):
+        """Programming errors in a skill are not reported as skill failures."""
+        class BuggySkill(SkillBase):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__('buggy', ['bug'])
+
+            def handle(self, user_input: str, context: dict = None) -> str:
+                return None + user_input
+
+        skill_router.register(BuggySkill())
+
+        with pytest.raises(TypeError):
+            skill_router.route("bug report")
+
+    def test_cached_route_respects_enabled_flag(self, skill_router, mock_weather_skill):
+        """A repeated input re-checks enabled flags instead of reusing a stale match."""
+        skill_router.register(mock_weather_skill)
+
+        assert skill_router.route("What's the weather?").skill == 'weather'
+        mock_weather_skill.enabled = False
+        assert skill_router.route("What's the weather?").skill is None
+        assert len(skill_router._route_cache) == 1
+
+    def test_route_matches_whole_words_and_phrases(self, skill_router, mock_weather_skill, mock_time_skill):
+        """Routing keeps word-boundary semantics for single and multi-word intents."""
+        skill_router.register(mock_weather_skill)
+        skill_router.register(mock_time_skill)
+
+        assert skill_router.route("Is it raining?").skill is None
+        assert skill_router.route("So, WHAT TIME is checkout?").skill == 'time'
+
+    def test_rebind_reassigned_handler(self, skill_router):
+        """A reassigned handle is only used once the skill is rebound."""
+        class ForecastSkill(SkillBase):
+            # No __slots__: instances keep a __dict__ so handle can be reassigned
+            def __init__(self):
+                super().__init__('forecast', ['forecast'])
+
+            def handle(self, user_input: str, context: dict = None) -> str:
+                return "Sunny."
+
+        skill = ForecastSkill()
+        skill_router.register(skill)
+        assert skill_router.route("forecast").response == "Sunny."
+
+        skill.handle = lambda user_input, context=None: "Rain all day."
+        skill_router.rebind('forecast')
+
+        assert skill_router.route("forecast").response == "Rain all day."
+
+    @pytest.mark.parametrize('user_input', [
+        "plan c", "c++ help", "learn c++now", "wi-fi password", "wi fi password",
+        "what's up", "what s up", "whats up", "?! ok", "hello",
+    ])
+    def test_route_agrees_with_matches_for_punctuated_intents(self, skill_router, user_input):
+        """route() picks a skill exactly when its matches() accepts the input."""
+        class PunctuationSkill(SkillBase):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__('punct', ['c++', 'wi-fi', "what's", '?!'])
+
+            def handle(self, user_input: str, context: dict = None) -> str:
+                return "ok"
+
+        skill = PunctuationSkill()
+        skill_router.register(skill)
+
+        expected = 'punct' if skill.matches(user_input) else None
+        assert skill_router.route(user_input).skill == expected
+
+    @pytest.mark.parametrize('intent, user_input', [
+        ('İstanbul', "istanbul trip"),
+        ('istanbul', "İstanbul trip"),
+        ('istanbul', "ıstanbul trip"),
+        ('ıstanbul', "istanbul trip"),
+    ])
+    def test_route_agrees_with_matches_when_casefold_differs(self, skill_router, intent, user_input):
+        """Intents and input whose casefold() splits or keeps apart letters still route."""
+        class CitySkill(SkillBase):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__('city', [intent])
+
+            def handle(self, user_input: str, context: dict = None) -> str:
+                return "ok"
+
+        skill = CitySkill()
+        skill_router.register(skill)
+
+        assert skill.matches(user_input)
+        assert skill_router.route(user_input).skill == 'city'
+
+    def test_punctuated_intents_need_exact_punctuation(self, skill_router):
+        """Stripped or split punctuation does not route to the skill."""
+        class WifiSkill(SkillBase):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__('wifi', ['wi-fi', 'c++'])
+
+            def handle(self, user_input: str, context: dict = None) -> str:
+                return "ok"
+
+        skill_router.register(WifiSkill())
+
+        assert skill_router.route("WI-FI password?").skill == 'wifi'
+        assert skill_router.route("wi fi password").skill is None
+        assert skill_router.route("plan c").skill is None
 
     def test_route_disabled_skill(self, skill_router, mock_weather_skill):
         """Test that disabled skills are not matched."""
@@ -274,8 +561,8 @@ class TestIntentRouting:
 
         result = skill_router.route("What's the weather?")
 
-        assert result['success'] is False
-        assert result['skill'] is None
+        assert result.success is False
+        assert result.skill is None
 
 
 class TestSkillExecution:
@@ -300,6 +587,8 @@ class TestSkillExecution:
     def test_skill_with_multiple_intents(self):
         """Test skill matching multiple intent patterns."""
         class MultiIntentSkill(SkillBase):
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__('multi', ['hello', 'hi', 'hey', 'greetings'])
 
@@ -321,6 +610,8 @@ class TestIntentRouterIntegration:
     def test_skill_priority(self, skill_router):
         """Test skill matching priority."""
         class SkillA(SkillBase):
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__('skill_a', ['test'])
 
@@ -328,6 +619,8 @@ class TestIntentRouterIntegration:
                 return "Response from A"
 
         class SkillB(SkillBase):
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__('skill_b', ['test'])
 
@@ -339,7 +632,11 @@ class TestIntentRouterIntegration:
 
         result = skill_router.route("test")
         # First registered skill should match
-        assert result['skill'] in ['skill_a', 'skill_b']
+        assert result.skill == 'skill_a'
+
+        # An explicit priority overrides registration order
+        skill_router.register(SkillB(), priority=-1)
+        assert skill_router.route("test").skill == 'skill_b'
 
     def test_list_skills(self, skill_router, mock_weather_skill, mock_time_skill):
         """Test listing all registered skills."""
@@ -371,8 +668,26 @@ class TestIntentRouterIntegration:
 
         for user_input, expected_skill in requests:
             result = skill_router.route(user_input)
-            assert result['skill'] == expected_skill
-            assert result['success'] is True
+            assert result.skill == expected_skill
+            assert result.success is True
+
+    def test_route_many(self, skill_router, mock_weather_skill, mock_time_skill):
+        """Batch routing returns the same results as routing one by one."""
+        skill_router.register(mock_weather_skill)
+        skill_router.register(mock_time_skill)
+
+        inputs = ["What's the weather?", "What time is it?", "Tell me a joke"]
+        results = skill_router.route_many(inputs, [{'session_id': 'a'}, None, None])
+
+        assert results == [skill_router.route(user_input) for user_input in inputs]
+        assert [result.skill for result in results] == ['weather', 'time', None]
+
+    def test_route_many_rejects_mismatched_contexts(self, skill_router, mock_weather_skill):
+        """A contexts list of the wrong length raises instead of dropping inputs."""
+        skill_router.register(mock_weather_skill)
+
+        with pytest.raises(ValueError):
+            skill_router.route_many(["What's the weather?", "Will it rain?"], [{'session_id': 'a'}])
 
 
 if __name__ == '__main__':